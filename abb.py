@@ -4,16 +4,64 @@ class Node:
         self.left = None
         self.right = None
 
-def insert(root, key):
+def insert_recursive(root, key):
     if root is None:
         return Node(key)
 
     if key < root.key:
-        root.left = insert(root.left, key)
+        root.left = insert_recursive(root.left, key)
     elif key > root.key:
-        root.right = insert(root.right, key)
+        root.right = insert_recursive(root.right, key)
     return root
 
+def insert(root, key):
+    if root is None:
+        return Node(key)
+
+    parent = None
+    current = root
+    while current is not None:
+        if key == current.key:
+            return root
+        parent = current
+        if key < current.key:
+            current = current.left
+        else:
+            current = current.right
+
+    if key < parent.key:
+        parent.left = Node(key)
+    else:
+        parent.right = Node(key)
+    return root
+
+def _unique_sorted(keys):
+    unicas = []
+    for key in keys:
+        if unicas:
+            if key < unicas[-1]:
+                raise ValueError("As chaves precisam estar em ordem crescente")
+            if key == unicas[-1]:
+                continue
+        unicas.append(key)
+    return unicas
+
+def _build_range(keys, lo, hi):
+    if lo > hi:
+        return None
+    mid = (lo + hi) // 2
+    node = Node(keys[mid])
+    node.left = _build_range(keys, lo, mid - 1)
+    node.right = _build_range(keys, mid + 1, hi)
+    return node
+
+def build_from_sorted(keys):
+    unicas = _unique_sorted(keys)
+    return _build_range(unicas, 0, len(unicas) - 1)
+
+def build_from_unsorted(keys):
+    return build_from_sorted(sorted(keys))
+
 def search(root, key):
     current = root
     while current is not None:
@@ -31,14 +79,14 @@ def _find_min(node):
         current = current.left
     return current
 
-def delete(root, key):
+def delete_recursive(root, key):
     if root is None:
         return None
 
     if key < root.key:
-        root.left = delete(root.left, key)
+        root.left = delete_recursive(root.left, key)
     elif key > root.key:
-        root.right = delete(root.right, key)
+        root.right = delete_recursive(root.right, key)
     else:
         if root.left is None and root.right is None:
             return None
@@ -50,19 +98,96 @@ def delete(root, key):
 
         successor = _find_min(root.right)
         root.key = successor.key
-        root.right = delete(root.right, successor.key)
+        root.right = delete_recursive(root.right, successor.key)
 
     return root
 
+def delete(root, key):
+    parent = None
+    current = root
+    while current is not None and current.key != key:
+        parent = current
+        if key < current.key:
+            current = current.left
+        else:
+            current = current.right
+
+    if current is None:
+        return root
+
+    if current.left is not None and current.right is not None:
+        # Sucessor: desce uma única vez pela subárvore direita e já desliga o nó
+        successor_parent = current
+        successor = current.right
+        while successor.left is not None:
+            successor_parent = successor
+            successor = successor.left
+
+        current.key = successor.key
+        if successor_parent is current:
+            successor_parent.right = successor.right
+        else:
+            successor_parent.left = successor.right
+        return root
+
+    child = current.left if current.left is not None else current.right
+
+    if parent is None:
+        return child
+    if parent.left is current:
+        parent.left = child
+    else:
+        parent.right = child
+    return root
+
 def height(root):
     if root is None:
         return 0
-    return 1 + max(height(root.left), height(root.right))
+
+    altura = 0
+    nivel = [root]
+    while nivel:
+        altura += 1
+        proximo = []
+        for node in nivel:
+            if node.left is not None:
+                proximo.append(node.left)
+            if node.right is not None:
+                proximo.append(node.right)
+        nivel = proximo
+    return altura
+
+def iter_inorder(root):
+    stack = []
+    current = root
+    while stack or current is not None:
+        while current is not None:
+            stack.append(current)
+            current = current.left
+        current = stack.pop()
+        yield current.key
+        current = current.right
 
 def inorder_traversal(root):
-    if root is None:
-        return []
-    return inorder_traversal(root.left) + [root.key] + inorder_traversal(root.right)
+    return list(iter_inorder(root))
+
+def range_query(root, lo, hi):
+    stack = []
+    current = root
+    while stack or current is not None:
+        while current is not None:
+            if current.key < lo:
+                current = current.right
+            else:
+                stack.append(current)
+                current = current.left
+        if not stack:
+            return
+        current = stack.pop()
+        if current.key > hi:
+            return
+        yield current.key
+        current = current.right
 
 def is_bst(root, min_key=None, max_key=None):
     
@@ -99,6 +224,7 @@ if __name__ == "__main__":
     print("É ABB válida?", is_bst(raiz1))
     print("Busca 40:", search(raiz1, 40) is not None)
     print("Busca 100:", search(raiz1, 100) is not None)
+    print("Chaves entre 35 e 65:", list(range_query(raiz1, 35, 65)))
 
     print("\nÁrvore (CENÁRIO 1):")
     print_tree(raiz1)
@@ -122,6 +248,10 @@ if __name__ == "__main__":
     print("É ABB válida?", is_bst(raiz2))
     print("\nÁrvore (pior caso, parecendo lista):")
     print_tree(raiz2)
+
+    raiz2b = build_from_sorted(valores2)
+    print("\nMesmas chaves com build_from_sorted (altura esperada 3):", height(raiz2b))
+    print_tree(raiz2b)
     print()
 
     print("CENÁRIO 3 – Inserção de duplicatas")
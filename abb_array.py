@@ -0,0 +1,185 @@
+from array import array
+
+NIL = -1
+
+
+class ArrayTree:
+    def __init__(self, capacity=0):
+        self.keys = array("q")
+        self.left = array("q")
+        self.right = array("q")
+        self.root = NIL
+        self.free = NIL
+        self.count = 0
+
+        if capacity > 0:
+            self.keys.extend([0] * capacity)
+            self.left.extend([NIL] * capacity)
+            self.right.extend([NIL] * capacity)
+            for i in range(capacity - 1, -1, -1):
+                self.left[i] = self.free
+                self.free = i
+
+    def _alloc(self, key):
+        if self.free != NIL:
+            index = self.free
+            self.free = self.left[index]
+            self.keys[index] = key
+            self.left[index] = NIL
+            self.right[index] = NIL
+        else:
+            index = len(self.keys)
+            self.keys.append(key)
+            self.left.append(NIL)
+            self.right.append(NIL)
+        self.count += 1
+        return index
+
+    def _release(self, index):
+        self.left[index] = self.free
+        self.right[index] = NIL
+        self.free = index
+        self.count -= 1
+
+    def memory_bytes(self):
+        return sum(a.itemsize * len(a) for a in (self.keys, self.left, self.right))
+
+
+def insert(tree, key):
+    keys, left, right = tree.keys, tree.left, tree.right
+
+    if tree.root == NIL:
+        tree.root = tree._alloc(key)
+        return tree
+
+    parent = NIL
+    current = tree.root
+    while current != NIL:
+        current_key = keys[current]
+        if key == current_key:
+            return tree
+        parent = current
+        if key < current_key:
+            current = left[current]
+        else:
+            current = right[current]
+
+    index = tree._alloc(key)
+    if key < keys[parent]:
+        left[parent] = index
+    else:
+        right[parent] = index
+    return tree
+
+
+def search(tree, key):
+    keys, left, right = tree.keys, tree.left, tree.right
+    current = tree.root
+    while current != NIL:
+        current_key = keys[current]
+        if key == current_key:
+            return current
+        if key < current_key:
+            current = left[current]
+        else:
+            current = right[current]
+    return NIL
+
+
+def delete(tree, key):
+    keys, left, right = tree.keys, tree.left, tree.right
+
+    parent = NIL
+    current = tree.root
+    while current != NIL and keys[current] != key:
+        parent = current
+        if key < keys[current]:
+            current = left[current]
+        else:
+            current = right[current]
+
+    if current == NIL:
+        return tree
+
+    if left[current] != NIL and right[current] != NIL:
+        successor_parent = current
+        successor = right[current]
+        while left[successor] != NIL:
+            successor_parent = successor
+            successor = left[successor]
+
+        keys[current] = keys[successor]
+        if successor_parent == current:
+            right[successor_parent] = right[successor]
+        else:
+            left[successor_parent] = right[successor]
+        tree._release(successor)
+        return tree
+
+    child = left[current] if left[current] != NIL else right[current]
+
+    if parent == NIL:
+        tree.root = child
+    elif left[parent] == current:
+        left[parent] = child
+    else:
+        right[parent] = child
+    tree._release(current)
+    return tree
+
+
+def height(tree):
+    if tree.root == NIL:
+        return 0
+
+    left, right = tree.left, tree.right
+    altura = 0
+    nivel = [tree.root]
+    while nivel:
+        altura += 1
+        proximo = []
+        for index in nivel:
+            if left[index] != NIL:
+                proximo.append(left[index])
+            if right[index] != NIL:
+                proximo.append(right[index])
+        nivel = proximo
+    return altura
+
+
+def iter_inorder(tree):
+    keys, left, right = tree.keys, tree.left, tree.right
+    stack = []
+    current = tree.root
+    while stack or current != NIL:
+        while current != NIL:
+            stack.append(current)
+            current = left[current]
+        current = stack.pop()
+        yield keys[current]
+        current = right[current]
+
+
+def inorder_traversal(tree):
+    return list(iter_inorder(tree))
+
+
+if __name__ == "__main__":
+    arvore = ArrayTree()
+    for v in [50, 30, 70, 20, 40, 60, 80]:
+        insert(arvore, v)
+
+    print("In-order:", inorder_traversal(arvore))
+    print("Altura:", height(arvore))
+    print("Busca 40:", search(arvore, 40) != NIL)
+    print("Busca 100:", search(arvore, 100) != NIL)
+
+    delete(arvore, 70)
+    delete(arvore, 30)
+    print("In-order após remover 70 e 30:", inorder_traversal(arvore))
+    print("Posições livres para reuso:", len(arvore.keys) - arvore.count)
+
+    insert(arvore, 65)
+    print("In-order após inserir 65:", inorder_traversal(arvore))
+    print("Posições alocadas:", len(arvore.keys))
+    print("Bytes por chave:", arvore.memory_bytes() / arvore.count)
@@ -1,31 +1,55 @@
-_rotation_count = 0
-
-def reset_rotation_count():
-    global _rotation_count
-    _rotation_count = 0
-
-def get_rotation_count():
-    return _rotation_count
+from concurrent.futures import ProcessPoolExecutor
+
+PARALLEL_THRESHOLD = 100_000
+SMALL_SIDE_HEIGHT = 3
+
+class AvlStats:
+    def __init__(self):
+        self.rotations = 0
+        self.comparisons = 0
+        self.searches = 0
+        self.search_nodes_visited = 0
+        self.updates = 0
+        self.retrace_steps = 0
+
+    def reset(self):
+        self.__init__()
+
+    def report(self):
+        def avg(total, count):
+            return total / count if count else 0.0
+
+        return {
+            "rotacoes": self.rotations,
+            "comparacoes": self.comparisons,
+            "nos_visitados_por_busca": avg(self.search_nodes_visited, self.searches),
+            "profundidade_media_retracao": avg(self.retrace_steps, self.updates),
+        }
 
 class AvlNode:
-    def __init__(self, key):
+    def __init__(self, key, sized=False, value=None):
         self.key = key
         self.left = None
         self.right = None
         self.height = 1
+        self.size = 1 if sized else None
+        self.value = value
 
 def _node_height(node):
     return 0 if node is None else node.height
 
+def _node_size(node):
+    return 0 if node is None else node.size
+
 def _update_height(node):
     node.height = 1 + max(_node_height(node.left), _node_height(node.right))
+    if node.size is not None:
+        node.size = 1 + _node_size(node.left) + _node_size(node.right)
 
 def _balance_factor(node):
     return _node_height(node.left) - _node_height(node.right)
 
-def _rotate_right(y):
-    global _rotation_count
-
+def _rotate_right(y, stats=None):
     x = y.left
     t2 = x.right if x else None
 
@@ -38,12 +62,11 @@ def _rotate_right(y):
     _update_height(y)
     _update_height(x)
 
-    _rotation_count += 1
+    if stats is not None:
+        stats.rotations += 1
     return x
 
-def _rotate_left(x):
-    global _rotation_count
-
+def _rotate_left(x, stats=None):
     y = x.right
     t2 = y.left if y else None
 
@@ -56,52 +79,181 @@ def _rotate_left(x):
     _update_height(x)
     _update_height(y)
 
-    _rotation_count += 1
+    if stats is not None:
+        stats.rotations += 1
     return y
 
-def insert(root, key):
+def insert_recursive(root, key, sized=False, stats=None, value=None):
+    if stats is not None:
+        stats.updates += 1
+    if root is not None:
+        sized = root.size is not None
+    return _insert_recursive(root, key, sized, stats, value)
+
+def _insert_recursive(root, key, sized, stats, value=None):
     if root is None:
-        return AvlNode(key)
+        return AvlNode(key, sized, value)
+
+    if stats is not None:
+        stats.comparisons += 1
 
     if key < root.key:
-        root.left = insert(root.left, key)
+        root.left = _insert_recursive(root.left, key, sized, stats, value)
     elif key > root.key:
-        root.right = insert(root.right, key)
+        root.right = _insert_recursive(root.right, key, sized, stats, value)
     else:
         return root
 
+    if stats is not None:
+        stats.retrace_steps += 1
+
     _update_height(root)
     balance = _balance_factor(root)
 
     if balance > 1 and key < root.left.key:
-        return _rotate_right(root)
+        return _rotate_right(root, stats)
 
     if balance < -1 and key > root.right.key:
-        return _rotate_left(root)
+        return _rotate_left(root, stats)
 
     if balance > 1 and key > root.left.key:
-        root.left = _rotate_left(root.left)
-        return _rotate_right(root)
+        root.left = _rotate_left(root.left, stats)
+        return _rotate_right(root, stats)
 
     if balance < -1 and key < root.right.key:
-        root.right = _rotate_right(root.right)
-        return _rotate_left(root)
+        root.right = _rotate_right(root.right, stats)
+        return _rotate_left(root, stats)
 
     return root
 
+def _rebalance(node, stats=None):
+    balance = _balance_factor(node)
+
+    if balance > 1:
+        if _balance_factor(node.left) < 0:
+            node.left = _rotate_left(node.left, stats)
+        return _rotate_right(node, stats)
+
+    if balance < -1:
+        if _balance_factor(node.right) > 0:
+            node.right = _rotate_right(node.right, stats)
+        return _rotate_left(node, stats)
+
+    return node
+
+def _retrace(root, path, size_delta, stats=None):
+    depth = len(path)
+    while path:
+        node = path.pop()
+        old_height = node.height
+        _update_height(node)
+        new_node = _rebalance(node, stats)
+
+        if not path:
+            root = new_node
+            break
+
+        parent = path[-1]
+        if new_node is not node:
+            if parent.left is node:
+                parent.left = new_node
+            else:
+                parent.right = new_node
+
+        if new_node.height == old_height:
+            if size_delta:
+                for ancestor in path:
+                    ancestor.size += size_delta
+            break
+
+    if stats is not None:
+        stats.retrace_steps += depth - len(path)
+    return root
+
+def insert(root, key, sized=False, stats=None, value=None):
+    if stats is not None:
+        stats.updates += 1
+
+    if root is None:
+        return AvlNode(key, sized, value)
+    sized = root.size is not None
+
+    path = []
+    current = root
+    while current is not None:
+        path.append(current)
+        if key < current.key:
+            current = current.left
+        elif key > current.key:
+            current = current.right
+        else:
+            if stats is not None:
+                stats.comparisons += len(path)
+            return root
+
+    if stats is not None:
+        stats.comparisons += len(path)
+
+    parent = path[-1]
+    if key < parent.key:
+        parent.left = AvlNode(key, sized, value)
+    else:
+        parent.right = AvlNode(key, sized, value)
+
+    return _retrace(root, path, 1 if sized else 0, stats)
+
+def _unique_sorted(keys, values=None):
+    unicas = []
+    valores = None if values is None else []
+    for i, key in enumerate(keys):
+        if unicas:
+            if key < unicas[-1]:
+                raise ValueError("As chaves precisam estar em ordem crescente")
+            if key == unicas[-1]:
+                continue
+        unicas.append(key)
+        if valores is not None:
+            valores.append(values[i])
+    return unicas, valores
+
+def _build_range(keys, lo, hi, sized, values=None):
+    if lo > hi:
+        return None
+    mid = (lo + hi) // 2
+    node = AvlNode(keys[mid], sized, None if values is None else values[mid])
+    node.left = _build_range(keys, lo, mid - 1, sized, values)
+    node.right = _build_range(keys, mid + 1, hi, sized, values)
+    _update_height(node)
+    return node
+
+def build_from_sorted(keys, sized=False, values=None):
+    unicas, valores = _unique_sorted(keys, values)
+    return _build_range(unicas, 0, len(unicas) - 1, sized, valores)
+
+def build_from_unsorted(keys, sized=False):
+    return build_from_sorted(sorted(keys), sized)
+
 def _find_min(root):
     while root.left is not None:
         root = root.left
     return root
 
-def delete(root, key):
+def delete_recursive(root, key, stats=None):
+    if stats is not None:
+        stats.updates += 1
+    return _delete_recursive(root, key, stats)
+
+def _delete_recursive(root, key, stats):
     if root is None:
         return None
 
+    if stats is not None:
+        stats.comparisons += 1
+
     if key < root.key:
-        root.left = delete(root.left, key)
+        root.left = _delete_recursive(root.left, key, stats)
     elif key > root.key:
-        root.right = delete(root.right, key)
+        root.right = _delete_recursive(root.right, key, stats)
     else:
         if root.left is None:
             return root.right
@@ -110,28 +262,103 @@ def delete(root, key):
 
         temp = _find_min(root.right)
         root.key = temp.key
-        root.right = delete(root.right, temp.key)
+        root.value = temp.value
+        root.right = _delete_recursive(root.right, temp.key, stats)
+
+    if stats is not None:
+        stats.retrace_steps += 1
 
     _update_height(root)
     balance = _balance_factor(root)
 
     if balance > 1 and _balance_factor(root.left) >= 0:
-        return _rotate_right(root)
+        return _rotate_right(root, stats)
 
     if balance > 1 and _balance_factor(root.left) < 0:
-        root.left = _rotate_left(root.left)
-        return _rotate_right(root)
+        root.left = _rotate_left(root.left, stats)
+        return _rotate_right(root, stats)
 
     if balance < -1 and _balance_factor(root.right) <= 0:
-        return _rotate_left(root)
+        return _rotate_left(root, stats)
 
     if balance < -1 and _balance_factor(root.right) > 0:
-        root.right = _rotate_right(root.right)
-        return _rotate_left(root)
+        root.right = _rotate_right(root.right, stats)
+        return _rotate_left(root, stats)
 
     return root
 
-def search(root, key):
+def delete(root, key, stats=None):
+    if stats is not None:
+        stats.updates += 1
+
+    path = []
+    current = root
+    while current is not None and current.key != key:
+        path.append(current)
+        if key < current.key:
+            current = current.left
+        else:
+            current = current.right
+
+    if stats is not None:
+        stats.comparisons += len(path) + (current is not None)
+
+    if current is None:
+        return root
+
+    sized = current.size is not None
+
+    if current.left is not None and current.right is not None:
+        depth = len(path)
+        path.append(current)
+        successor = current.right
+        while successor.left is not None:
+            path.append(successor)
+            successor = successor.left
+        if stats is not None:
+            stats.comparisons += len(path) - depth
+        current.key = successor.key
+        current.value = successor.value
+        removed = successor
+        child = successor.right
+    else:
+        removed = current
+        child = current.left if current.left is not None else current.right
+
+    if not path:
+        return child
+
+    parent = path[-1]
+    if parent.left is removed:
+        parent.left = child
+    else:
+        parent.right = child
+
+    return _retrace(root, path, -1 if sized else 0, stats)
+
+def _search_counting(root, key, stats):
+    visited = 0
+    current = root
+    result = None
+    while current:
+        visited += 1
+        if key == current.key:
+            result = current
+            break
+        elif key < current.key:
+            current = current.left
+        else:
+            current = current.right
+
+    stats.searches += 1
+    stats.search_nodes_visited += visited
+    stats.comparisons += visited
+    return result
+
+def search(root, key, stats=None):
+    if stats is not None:
+        return _search_counting(root, key, stats)
+
     current = root
     while current:
         if key == current.key:
@@ -145,10 +372,265 @@ def search(root, key):
 def height(root):
     return _node_height(root)
 
-def inorder_traversal(root):
+def _require_size(root):
+    if root is not None and root.size is None:
+        raise ValueError("Estatísticas de ordem exigem uma árvore criada com sized=True")
+
+def _count_below(root, key, inclusive):
+    count = 0
+    current = root
+    while current is not None:
+        if key < current.key or (key == current.key and not inclusive):
+            current = current.left
+        else:
+            count += 1 + _node_size(current.left)
+            current = current.right
+    return count
+
+def rank(root, key):
+    _require_size(root)
+    return _count_below(root, key, inclusive=False)
+
+def select(root, k):
+    _require_size(root)
+    if k < 0 or k >= _node_size(root):
+        raise IndexError("Posição fora do intervalo da árvore")
+
+    current = root
+    while True:
+        left_size = _node_size(current.left)
+        if k < left_size:
+            current = current.left
+        elif k == left_size:
+            return current.key
+        else:
+            k -= left_size + 1
+            current = current.right
+
+def count_range(root, lo, hi):
+    _require_size(root)
+    if lo > hi:
+        return 0
+    return _count_below(root, hi, inclusive=True) - _count_below(root, lo, inclusive=False)
+
+def _is_sized(*roots):
+    sized = {root.size is not None for root in roots if root is not None}
+    if len(sized) > 1:
+        raise ValueError("Árvores com e sem tamanho das subárvores não podem ser combinadas")
+    return True in sized
+
+def _join_right(t1, key, t2, sized):
+    if _node_height(t1.right) <= _node_height(t2) + 1:
+        node = AvlNode(key, sized)
+        node.left = t1.right
+        node.right = t2
+        _update_height(node)
+        t1.right = node
+    else:
+        t1.right = _join_right(t1.right, key, t2, sized)
+    _update_height(t1)
+    return _rebalance(t1)
+
+def _join_left(t1, key, t2, sized):
+    if _node_height(t2.left) <= _node_height(t1) + 1:
+        node = AvlNode(key, sized)
+        node.left = t1
+        node.right = t2.left
+        _update_height(node)
+        t2.left = node
+    else:
+        t2.left = _join_left(t1, key, t2.left, sized)
+    _update_height(t2)
+    return _rebalance(t2)
+
+def _join(t1, key, t2, sized):
+    if _node_height(t1) > _node_height(t2) + 1:
+        return _join_right(t1, key, t2, sized)
+    if _node_height(t2) > _node_height(t1) + 1:
+        return _join_left(t1, key, t2, sized)
+
+    node = AvlNode(key, sized)
+    node.left = t1
+    node.right = t2
+    _update_height(node)
+    return node
+
+def _split_last(root, sized):
+    if root.right is None:
+        return root.left, root.key
+    rest, last = _split_last(root.right, sized)
+    return _join(root.left, root.key, rest, sized), last
+
+def _join2(t1, t2, sized):
+    if t1 is None:
+        return t2
+    rest, last = _split_last(t1, sized)
+    return _join(rest, last, t2, sized)
+
+def _split(root, key, sized):
     if root is None:
-        return []
-    return inorder_traversal(root.left) + [root.key] + inorder_traversal(root.right)
+        return None, False, None
+    if key == root.key:
+        return root.left, True, root.right
+    if key < root.key:
+        left, found, right = _split(root.left, key, sized)
+        return left, found, _join(right, root.key, root.right, sized)
+    left, found, right = _split(root.right, key, sized)
+    return _join(root.left, root.key, left, sized), found, right
+
+# join, split e as operações de conjunto reaproveitam os nós das árvores
+# recebidas: depois da chamada, use apenas as árvores devolvidas.
+
+def join(t1, key, t2):
+    return _join(t1, key, t2, _is_sized(t1, t2))
+
+def split(root, key):
+    return _split(root, key, _is_sized(root))
+
+def _insert_all(target, source, sized):
+    for key in iter_inorder(source):
+        target = insert(target, key, sized)
+    return target
+
+def _union(t1, t2, sized):
+    if t1 is None:
+        return t2
+    if t2 is None:
+        return t1
+    if t2.height <= SMALL_SIDE_HEIGHT:
+        return _insert_all(t1, t2, sized)
+    if t1.height <= SMALL_SIDE_HEIGHT:
+        return _insert_all(t2, t1, sized)
+    key, (l1, l2), (r1, r2) = _union_step(t1, t2, sized)
+    return _join(_union(l1, l2, sized), key, _union(r1, r2, sized), sized)
+
+def _union_step(t1, t2, sized):
+    l2, _, r2 = _split(t2, t1.key, sized)
+    return t1.key, (t1.left, l2), (t1.right, r2)
+
+def _intersection(t1, t2, sized):
+    if t1 is None or t2 is None:
+        return None
+    key, (l1, l2), (r1, r2) = _intersection_step(t1, t2, sized)
+    left = _intersection(l1, l2, sized)
+    right = _intersection(r1, r2, sized)
+    if key is None:
+        return _join2(left, right, sized)
+    return _join(left, key, right, sized)
+
+def _intersection_step(t1, t2, sized):
+    l2, found, r2 = _split(t2, t1.key, sized)
+    return (t1.key if found else None), (t1.left, l2), (t1.right, r2)
+
+def _difference(t1, t2, sized):
+    if t1 is None or t2 is None:
+        return t1
+    _, (l1, l2), (r1, r2) = _difference_step(t1, t2, sized)
+    return _join2(_difference(l1, l2, sized), _difference(r1, r2, sized), sized)
+
+def _difference_step(t1, t2, sized):
+    l1, _, r1 = _split(t1, t2.key, sized)
+    return None, (l1, t2.left), (r1, t2.right)
+
+def _estimated_size(root):
+    if root is None:
+        return 0
+    if root.size is not None:
+        return root.size
+    return 1 << (root.height - 1)
+
+def _plan(step, t1, t2, sized, depth):
+    if depth == 0 or t1 is None or t2 is None:
+        return ("folha", t1, t2)
+    key, left, right = step(t1, t2, sized)
+    return (
+        "no",
+        key,
+        _plan(step, left[0], left[1], sized, depth - 1),
+        _plan(step, right[0], right[1], sized, depth - 1),
+    )
+
+def _plan_leaves(plan, leaves):
+    if plan[0] == "folha":
+        leaves.append(plan)
+    else:
+        _plan_leaves(plan[2], leaves)
+        _plan_leaves(plan[3], leaves)
+    return leaves
+
+def _plan_fold(plan, results, sized):
+    if plan[0] == "folha":
+        return next(results)
+    left = _plan_fold(plan[2], results, sized)
+    right = _plan_fold(plan[3], results, sized)
+    if plan[1] is None:
+        return _join2(left, right, sized)
+    return _join(left, plan[1], right, sized)
+
+def _run_set_operation(operation, step, t1, t2, workers, threshold):
+    sized = _is_sized(t1, t2)
+    if (
+        workers is None
+        or workers < 2
+        or _estimated_size(t1) + _estimated_size(t2) < threshold
+    ):
+        return operation(t1, t2, sized)
+
+    plan = _plan(step, t1, t2, sized, workers.bit_length())
+    leaves = _plan_leaves(plan, [])
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(
+            operation,
+            [leaf[1] for leaf in leaves],
+            [leaf[2] for leaf in leaves],
+            [sized] * len(leaves),
+        )
+        return _plan_fold(plan, iter(results), sized)
+
+def union(t1, t2, workers=None, threshold=PARALLEL_THRESHOLD):
+    return _run_set_operation(_union, _union_step, t1, t2, workers, threshold)
+
+def intersection(t1, t2, workers=None, threshold=PARALLEL_THRESHOLD):
+    return _run_set_operation(_intersection, _intersection_step, t1, t2, workers, threshold)
+
+def difference(t1, t2, workers=None, threshold=PARALLEL_THRESHOLD):
+    return _run_set_operation(_difference, _difference_step, t1, t2, workers, threshold)
+
+def iter_nodes(root):
+    stack = []
+    current = root
+    while stack or current is not None:
+        while current is not None:
+            stack.append(current)
+            current = current.left
+        current = stack.pop()
+        yield current
+        current = current.right
+
+def iter_inorder(root):
+    for node in iter_nodes(root):
+        yield node.key
+
+def inorder_traversal(root):
+    return list(iter_inorder(root))
+
+def range_query(root, lo, hi):
+    stack = []
+    current = root
+    while stack or current is not None:
+        while current is not None:
+            if current.key < lo:
+                current = current.right
+            else:
+                stack.append(current)
+                current = current.left
+        if not stack:
+            return
+        current = stack.pop()
+        if current.key > hi:
+            return
+        yield current.key
+        current = current.right
 
 def is_bst(root, min_key=None, max_key=None):
     if root is None:
@@ -176,15 +658,19 @@ def print_tree(root, level=0, branch="*"):
 if __name__ == "__main__":
     valores = [50, 30, 70, 20, 40, 60, 80, 10, 25, 35, 45]
     raiz = None
-    reset_rotation_count()
+    estatisticas = AvlStats()
 
     for v in valores:
-        raiz = insert(raiz, v)
+        raiz = insert(raiz, v, sized=True, stats=estatisticas)
 
     print("Valores em ordem:", inorder_traversal(raiz))
     print("Altura AVL :", height(raiz))
     print("É árvore de busca?", is_bst(raiz))
-    print("Rotações nas inserções:", get_rotation_count())
+    print("Rotações nas inserções:", estatisticas.rotations)
+    print("Chaves entre 22 e 48:", list(range_query(raiz, 22, 48)))
+    print("Quantas chaves abaixo de 40 (rank):", rank(raiz, 40))
+    print("Quinta menor chave (select 4):", select(raiz, 4))
+    print("Quantas chaves entre 22 e 48:", count_range(raiz, 22, 48))
 
     print("\nÁrvore AVL após inserções:")
     print_tree(raiz)
@@ -196,4 +682,15 @@ if __name__ == "__main__":
     print("\nÁrvore AVL após deleções:")
     print_tree(raiz)
     print("Altura final:", height(raiz))
-    print("ABB/AVL válida?", is_bst(raiz))
\ No newline at end of file
+    print("ABB/AVL válida?", is_bst(raiz))
+
+    com_tamanho = build_from_sorted(range(0, 40, 2), sized=True)
+    sem_tamanho = build_from_sorted(range(0, 40, 3))
+    print("\nUnião de árvores com tamanho:", inorder_traversal(union(com_tamanho, build_from_sorted([1, 3], sized=True))))
+    for operacao in (union, intersection, difference):
+        for a, b in ((com_tamanho, sem_tamanho), (sem_tamanho, com_tamanho)):
+            try:
+                operacao(a, b)
+                print(f"{operacao.__name__} misturando árvores: aceito (inesperado)")
+            except ValueError as erro:
+                print(f"{operacao.__name__} misturando árvores: {erro}")
\ No newline at end of file
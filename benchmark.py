@@ -2,34 +2,55 @@ import sys
 import time
 import random
 import csv 
+import gc
+import os
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+import tracemalloc
 
 from abb import insert as abb_insert, search as abb_search, delete as abb_delete, height as abb_height
+from abb import insert_recursive as abb_insert_recursive, delete_recursive as abb_delete_recursive
+import abb
+import abb_array
 import avl
 from hash_open import OpenAddressHashTable
 from hash_chaining import HashTableChaining
+from hash_cuckoo import CuckooHashTable
+from hash_swiss import SwissHashTable
+from hash_concurrent import StripedHashTableChaining, LockedHashTableChaining
+from latency import format_summary
+from bloom import BloomFilter, CountingBloomFilter, FilteredTable, FilteredTree
+from snapshot import write_hash_snapshot, write_sorted_snapshot, open_snapshot
+from shared_table import SharedTablePublisher, SharedTableReader
+from tracing import TextSink
+import hash_chaining
+import hash_open
 
 from datasets import (
     gerar_aleatorio,
     gerar_ordenado,
     gerar_quase_ordenado,
     montar_chaves_busca,
+    gerar_colisoes,
+    gerar_espacado,
 )
 
-sys.setrecursionlimit(300_000)
-
 class ABBWrapper:
 
-    def __init__(self):
+    def __init__(self, iterativa: bool = True):
         self.root = None
+        self._insert = abb_insert if iterativa else abb_insert_recursive
+        self._delete = abb_delete if iterativa else abb_delete_recursive
 
     def insert(self, key: int) -> None:
-        self.root = abb_insert(self.root, key)
+        self.root = self._insert(self.root, key)
 
     def search(self, key: int) -> bool:
         return abb_search(self.root, key) is not None
 
     def delete(self, key: int) -> None:
-        self.root = abb_delete(self.root, key)
+        self.root = self._delete(self.root, key)
 
     def extra_metrics(self) -> dict:
         return {
@@ -37,35 +58,57 @@ class ABBWrapper:
         }
 
 
-class AVLWrapper:
+class ABBArrayWrapper:
 
     def __init__(self):
+        self.tree = abb_array.ArrayTree()
+
+    def insert(self, key: int) -> None:
+        abb_array.insert(self.tree, key)
+
+    def search(self, key: int) -> bool:
+        return abb_array.search(self.tree, key) != abb_array.NIL
+
+    def delete(self, key: int) -> None:
+        abb_array.delete(self.tree, key)
+
+    def extra_metrics(self) -> dict:
+        return {
+            "altura_final": abb_array.height(self.tree),
+        }
+
+
+class AVLWrapper:
+
+    def __init__(self, iterativa: bool = True, estatisticas: bool = False):
         self.root = None
-        if hasattr(avl, "reset_rotation_count"):
-            avl.reset_rotation_count()
+        self._insert = avl.insert if iterativa else avl.insert_recursive
+        self._delete = avl.delete if iterativa else avl.delete_recursive
+        self.stats = avl.AvlStats() if estatisticas else None
 
     def insert(self, key: int) -> None:
-        self.root = avl.insert(self.root, key)
+        self.root = self._insert(self.root, key, stats=self.stats)
 
     def search(self, key: int) -> bool:
-        return avl.search(self.root, key) is not None
+        return avl.search(self.root, key, self.stats) is not None
 
     def delete(self, key: int) -> None:
-        self.root = avl.delete(self.root, key)
+        self.root = self._delete(self.root, key, stats=self.stats)
 
     def extra_metrics(self) -> dict:
         metrics = {
             "altura_final": avl.height(self.root),
         }
-        if hasattr(avl, "get_rotation_count"):
-            metrics["rotacoes"] = avl.get_rotation_count()
+        if self.stats is not None:
+            metrics.update(self.stats.report())
         return metrics
 
 
 class HashOpenWrapper:
 
-    def __init__(self, size: int, method: str):
-        self.table = OpenAddressHashTable(size=size, method=method)
+    def __init__(self, size: int, method: str, **opcoes):
+        opcoes.setdefault("timing", False)
+        self.table = OpenAddressHashTable(size=size, method=method, **opcoes)
 
     def insert(self, key: int) -> None:
         self.table.insert(key)
@@ -81,13 +124,40 @@ class HashOpenWrapper:
             "tamanho_tabela": self.table.size,
             "fator_de_carga": round(self.table.load_factor(), 3),
             "colisoes_totais": self.table.collision_count,
+            "redimensionamentos": self.table.resize_count,
+            "compactacoes": self.table.compaction_count,
         }
 
 
 class HashChainingWrapper:
 
-    def __init__(self, size: int):
-        self.table = HashTableChaining(size=size, debug=False)
+    def __init__(self, size: int, **opcoes):
+        opcoes.setdefault("timing", False)
+        self.table = HashTableChaining(size=size, debug=False, **opcoes)
+
+    def insert(self, key: int) -> None:
+        self.table.insert(key)
+
+    def search(self, key: int) -> bool:
+        return self.table.search(key)
+
+    def delete(self, key: int) -> None:
+        self.table.remove(key)
+
+    def extra_metrics(self) -> dict:
+        return {
+            "tamanho_tabela": self.table.size,
+            "colisoes_totais": self.table.collision_count,
+            "redimensionamentos": self.table.resize_count,
+            "conversoes_arvore": self.table.treeify_count,
+        }
+
+
+class CuckooWrapper:
+
+    def __init__(self, size: int, **opcoes):
+        opcoes.setdefault("timing", False)
+        self.table = CuckooHashTable(size=size, **opcoes)
 
     def insert(self, key: int) -> None:
         self.table.insert(key)
@@ -101,7 +171,9 @@ class HashChainingWrapper:
     def extra_metrics(self) -> dict:
         return {
             "tamanho_tabela": self.table.size,
+            "fator_de_carga": round(self.table.load_factor(), 3),
             "colisoes_totais": self.table.collision_count,
+            "rehashes": self.table.rehash_count,
         }
 
 
@@ -156,12 +228,28 @@ def imprimir_resultado(r: dict) -> None:
         print(f"  Altura final        : {r['altura_final']}")
     if "rotacoes" in r:
         print(f"  Rotações            : {r['rotacoes']}")
+    if "comparacoes" in r:
+        print(f"  Comparações de chave: {r['comparacoes']}")
+    if "nos_visitados_por_busca" in r:
+        print(f"  Nós por busca       : {r['nos_visitados_por_busca']:.2f}")
+    if "profundidade_media_retracao" in r:
+        print(f"  Retração média      : {r['profundidade_media_retracao']:.2f} níveis")
     if "tamanho_tabela" in r:
         print(f"  Tamanho da tabela   : {r['tamanho_tabela']}")
     if "fator_de_carga" in r:
         print(f"  Fator de carga      : {r['fator_de_carga']}")
     if "colisoes_totais" in r:
         print(f"  Colisões totais     : {r['colisoes_totais']}")
+    if "redimensionamentos" in r:
+        print(f"  Redimensionamentos  : {r['redimensionamentos']}")
+    if "rehashes" in r:
+        print(f"  Rehashes            : {r['rehashes']}")
+    if r.get("compactacoes"):
+        print(f"  Compactações        : {r['compactacoes']}")
+    if r.get("conversoes_arvore"):
+        print(f"  Listas viradas AVL  : {r['conversoes_arvore']}")
+    if "bytes_por_chave" in r:
+        print(f"  Bytes por chave     : {r['bytes_por_chave']}")
     print()
 
 
@@ -177,6 +265,9 @@ def salvar_resultados_csv(resultados: list, caminho: str) -> None:
         "tempo_medio_remocao",
         "altura_final",
         "rotacoes",
+        "comparacoes",
+        "nos_visitados_por_busca",
+        "profundidade_media_retracao",
         "tamanho_tabela",
         "fator_de_carga",
         "colisoes_totais",
@@ -207,8 +298,8 @@ def main():
     }
 
     estruturas_arvores = {
-        "ABB": lambda: ABBWrapper(),
-        "AVL": lambda: AVLWrapper(),
+        "ABB": (lambda: ABBWrapper(), None),
+        "AVL": (lambda: AVLWrapper(), lambda: AVLWrapper(estatisticas=True)),
     }
 
     resultados_csv = []
@@ -218,7 +309,8 @@ def main():
         print(f"DATASET: {nome_dataset}  (N={N}, M={M}, K={K})")
         print("====================================")
 
-        for nome_estrutura, fabrica in estruturas_arvores.items():
+        for nome_estrutura, (fabrica, fabrica_metricas) in estruturas_arvores.items():
+            estado = random.getstate()
             r = executar_benchmark_estrutura(
                 nome_estrutura=nome_estrutura,
                 fabrica=fabrica,
@@ -226,6 +318,11 @@ def main():
                 m=M,
                 k=K,
             )
+            if fabrica_metricas is not None:
+                # Contadores vêm de uma segunda execução com as mesmas chaves, fora da medição de tempo
+                random.setstate(estado)
+                metricas = executar_benchmark_estrutura(nome_estrutura, fabrica_metricas, chaves, M, K)
+                r.update((chave, valor) for chave, valor in metricas.items() if not chave.startswith("tempo_"))
             imprimir_resultado(r)
 
             resultados_csv.append({
@@ -239,6 +336,9 @@ def main():
                 "tempo_medio_remocao": r["tempo_medio_remocao"],
                 "altura_final": r.get("altura_final", ""),
                 "rotacoes": r.get("rotacoes", ""),
+                "comparacoes": r.get("comparacoes", ""),
+                "nos_visitados_por_busca": r.get("nos_visitados_por_busca", ""),
+                "profundidade_media_retracao": r.get("profundidade_media_retracao", ""),
                 "tamanho_tabela": r.get("tamanho_tabela", ""),
                 "fator_de_carga": r.get("fator_de_carga", ""),
                 "colisoes_totais": r.get("colisoes_totais", ""),
@@ -269,7 +369,7 @@ def main():
             "colisoes_totais": r.get("colisoes_totais", ""),
         })
 
-        for metodo in ("linear", "quadratic", "double"):
+        for metodo in ("linear", "quadratic", "double", "robinhood"):
             r = executar_benchmark_estrutura(
                 nome_estrutura=f"Hash (enderecamento aberto, {metodo})",
                 fabrica=lambda m=metodo: HashOpenWrapper(
@@ -298,8 +398,1047 @@ def main():
                 "colisoes_totais": r.get("colisoes_totais", ""),
             })
 
+        r = executar_benchmark_estrutura(
+            nome_estrutura="Hash (cuckoo, 2 funções)",
+            fabrica=lambda: CuckooWrapper(size=tamanho_tabela_hash),
+            chaves_base=chaves,
+            m=M,
+            k=K,
+        )
+
+        imprimir_resultado(r)
+        resultados_csv.append({
+            "dataset": nome_dataset,
+            "estrutura": r["estrutura"],
+            "N": N,
+            "M": M,
+            "K": K,
+            "tempo_medio_insercao": r["tempo_medio_insercao"],
+            "tempo_medio_busca": r["tempo_medio_busca"],
+            "tempo_medio_remocao": r["tempo_medio_remocao"],
+            "altura_final": "",
+            "rotacoes": "",
+            "tamanho_tabela": r.get("tamanho_tabela", ""),
+            "fator_de_carga": r.get("fator_de_carga", ""),
+            "colisoes_totais": r.get("colisoes_totais", ""),
+        })
+
     salvar_resultados_csv(resultados_csv, "resultados_benchmark.csv")
 
 
+def comparar_abb_recursiva_iterativa():
+    N = 5_000
+    M = N
+    K = N // 10
+    random.seed(42)
+
+    chaves = gerar_ordenado(N)
+
+    limite_anterior = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(limite_anterior, 2 * N + 1_000))
+
+    print("\n====================================")
+    print(f"ABB recursiva x iterativa - dataset ordenado (N={N}, M={M}, K={K})")
+    print("====================================")
+
+    try:
+        for nome_estrutura, iterativa in (("ABB (recursiva)", False), ("ABB (iterativa)", True)):
+            r = executar_benchmark_estrutura(
+                nome_estrutura=nome_estrutura,
+                fabrica=lambda it=iterativa: ABBWrapper(iterativa=it),
+                chaves_base=chaves,
+                m=M,
+                k=K,
+            )
+            imprimir_resultado(r)
+    finally:
+        sys.setrecursionlimit(limite_anterior)
+
+
+def comparar_carga_em_lote():
+    N = 10_000
+    random.seed(42)
+
+    datasets = {
+        "aleatorio": gerar_aleatorio(N),
+        "ordenado": gerar_ordenado(N),
+        "quase_ordenado": gerar_quase_ordenado(N),
+    }
+
+    for nome_dataset, chaves in datasets.items():
+        print("\n====================================")
+        print(f"Carga incremental x em lote - dataset {nome_dataset} (N={N})")
+        print("====================================")
+
+        for nome_estrutura, modulo in (("ABB", abb), ("AVL", avl)):
+            raiz = None
+            estatisticas = avl.AvlStats()
+            extras = {"stats": estatisticas} if modulo is avl else {}
+            inicio = time.perf_counter()
+            for chave in chaves:
+                raiz = modulo.insert(raiz, chave, **extras)
+            tempo_incremental = time.perf_counter() - inicio
+            altura_incremental = modulo.height(raiz)
+            rotacoes = estatisticas.rotations
+
+            inicio = time.perf_counter()
+            if nome_dataset == "ordenado":
+                raiz = modulo.build_from_sorted(chaves)
+            else:
+                raiz = modulo.build_from_unsorted(chaves)
+            tempo_lote = time.perf_counter() - inicio
+
+            print(f"\nEstrutura: {nome_estrutura}")
+            print(f"  Inserção incremental: {tempo_incremental:.6f} s (altura {altura_incremental})")
+            if nome_estrutura == "AVL":
+                print(f"  Rotações incrementais: {rotacoes}")
+            print(f"  Carga em lote       : {tempo_lote:.6f} s (altura {modulo.height(raiz)})")
+
+
+def comparar_avl_recursiva_iterativa():
+    N = 25_000
+    M = N
+    K = N // 10
+    random.seed(42)
+
+    datasets = {
+        "aleatorio": gerar_aleatorio(N),
+        "ordenado": gerar_ordenado(N),
+        "quase_ordenado": gerar_quase_ordenado(N),
+    }
+
+    for nome_dataset, chaves in datasets.items():
+        print("\n====================================")
+        print(f"AVL recursiva x iterativa - dataset {nome_dataset} (N={N}, M={M}, K={K})")
+        print("====================================")
+
+        for nome_estrutura, iterativa in (("AVL (recursiva)", False), ("AVL (iterativa)", True)):
+            r = executar_benchmark_estrutura(
+                nome_estrutura=nome_estrutura,
+                fabrica=lambda it=iterativa: AVLWrapper(iterativa=it, estatisticas=True),
+                chaves_base=chaves,
+                m=M,
+                k=K,
+            )
+            imprimir_resultado(r)
+
+
+def comparar_conjuntos_avl():
+    N = 200_000
+    random.seed(42)
+
+    chaves_grandes = gerar_aleatorio(N)
+    for m in (N // 100, N // 10, N):
+        chaves_pequenas = gerar_aleatorio(m)
+
+        print("\n====================================")
+        print(f"União de árvores AVL (n={N}, m={m})")
+        print("====================================")
+
+        grande = avl.build_from_unsorted(chaves_grandes)
+        pequena = avl.build_from_unsorted(chaves_pequenas)
+        estatisticas = avl.AvlStats()
+        inicio = time.perf_counter()
+        for chave in avl.iter_inorder(pequena):
+            grande = avl.insert(grande, chave, stats=estatisticas)
+        print(f"  Laço de inserções   : {time.perf_counter() - inicio:.6f} s (rotações {estatisticas.rotations})")
+
+        for nome, workers in (("union", None), ("union (4 processos)", 4)):
+            grande = avl.build_from_unsorted(chaves_grandes)
+            pequena = avl.build_from_unsorted(chaves_pequenas)
+            inicio = time.perf_counter()
+            uniao = avl.union(grande, pequena, workers=workers)
+            print(f"  {nome:<20}: {time.perf_counter() - inicio:.6f} s (altura {avl.height(uniao)})")
+
+
+def comparar_rehash_incremental():
+    N = 200_000
+    M = N
+    K = N // 2
+    random.seed(42)
+
+    chaves = gerar_aleatorio(N)
+
+    print("\n====================================")
+    print(f"Rehash incremental x total - encadeamento externo (N={N}, tamanho inicial 11)")
+    print("====================================")
+
+    for nome_estrutura, incremental in (("Rehash total", False), ("Rehash incremental", True)):
+        wrapper = HashChainingWrapper(size=11, incremental=incremental, timing=True)
+
+        # Sem o coletor de lixo, as pausas que sobram na cauda são só do rehash
+        gc.disable()
+        try:
+            r = executar_benchmark_estrutura(
+                nome_estrutura=nome_estrutura,
+                fabrica=lambda: wrapper,
+                chaves_base=chaves,
+                m=M,
+                k=K,
+            )
+        finally:
+            gc.enable()
+        imprimir_resultado(r)
+
+        for nome_operacao, histograma in (
+            ("inserção", wrapper.table.insert_latency),
+            ("remoção", wrapper.table.remove_latency),
+        ):
+            print("  " + format_summary(nome_operacao, histograma.summary()))
+
+
+def comparar_custo_tracing():
+    N = 50_000
+    M = N
+    K = N // 10
+    random.seed(42)
+
+    chaves = gerar_aleatorio(N)
+
+    def descartar(_mensagem):
+        pass
+
+    print("\n====================================")
+    print(f"Custo do tracing nas tabelas hash - dataset aleatorio (N={N})")
+    print("====================================")
+
+    for nome_tabela, modulo, fabrica in (
+        ("encadeamento externo", hash_chaining, lambda **o: HashChainingWrapper(size=N * 2, **o)),
+        ("enderecamento aberto, linear", hash_open, lambda **o: HashOpenWrapper(size=N * 2, method="linear", **o)),
+    ):
+        for nome_modo, opcoes in (
+            ("mensagens formatadas e descartadas", {"trace_sink": TextSink(modulo.TRACE_MESSAGES, write=descartar)}),
+            ("tracing desligado", {}),
+        ):
+            r = executar_benchmark_estrutura(
+                nome_estrutura=f"Hash ({nome_tabela}) - {nome_modo}",
+                fabrica=lambda o=opcoes: fabrica(**o),
+                chaves_base=chaves,
+                m=M,
+                k=K,
+            )
+            imprimir_resultado(r)
+
+
+def comparar_operacoes_em_lote():
+    N = 100_000
+    random.seed(42)
+
+    chaves = gerar_aleatorio(N)
+    itens = [(chave, chave * 2) for chave in chaves]
+    chaves_busca = montar_chaves_busca(chaves, N)
+    chaves_remocao = random.sample(chaves, N // 2)
+
+    print("\n====================================")
+    print(f"Laço por chave x API em lote (N={N})")
+    print("====================================")
+
+    for nome_tabela, fabrica in (
+        ("encadeamento externo", lambda: HashTableChaining(size=N * 2, timing=False)),
+        ("enderecamento aberto, linear", lambda: OpenAddressHashTable(size=N * 2, method="linear", timing=False)),
+    ):
+        tabela = fabrica()
+        inicio = time.perf_counter()
+        for chave, valor in itens:
+            tabela.put(chave, valor)
+        tempo_put = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        valores = [tabela.get(chave) for chave in chaves_busca]
+        tempo_get = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        for chave in chaves_remocao:
+            tabela.pop(chave, None)
+        tempo_pop = time.perf_counter() - inicio
+
+        tabela = fabrica()
+        inicio = time.perf_counter()
+        tabela.put_many(itens)
+        tempo_put_many = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        valores_lote = tabela.get_many(chaves_busca)
+        tempo_get_many = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        tabela.delete_many(chaves_remocao)
+        tempo_delete_many = time.perf_counter() - inicio
+
+        assert valores == valores_lote
+
+        print(f"\nEstrutura: Hash ({nome_tabela})")
+        print(f"  put    : {tempo_put / N:.6e} s/chave | put_many   : {tempo_put_many / N:.6e} s/chave")
+        print(f"  get    : {tempo_get / N:.6e} s/chave | get_many   : {tempo_get_many / N:.6e} s/chave")
+        print(
+            f"  pop    : {tempo_pop / len(chaves_remocao):.6e} s/chave | "
+            f"delete_many: {tempo_delete_many / len(chaves_remocao):.6e} s/chave"
+        )
+
+
+def comparar_ataque_colisoes():
+    N = 20_000
+    M = N
+    K = N // 10
+    random.seed(42)
+
+    for grupos in (1, 16):
+        chaves = gerar_colisoes(N, grupos=grupos)
+
+        print("\n====================================")
+        print(f"Ataque de colisões - {grupos} valor(es) de hash (N={N}, M={M}, K={K})")
+        print("====================================")
+
+        for nome_estrutura, opcoes in (
+            ("Hash (encadeamento externo, listas)", {"treeify_threshold": None}),
+            ("Hash (encadeamento externo, listas + AVL)", {}),
+        ):
+            r = executar_benchmark_estrutura(
+                nome_estrutura=nome_estrutura,
+                fabrica=lambda o=opcoes: HashChainingWrapper(size=N * 2, **o),
+                chaves_base=chaves,
+                m=M,
+                k=K,
+            )
+            imprimir_resultado(r)
+
+
+def medir_bytes_por_chave(fabrica, chaves: list[int]) -> float:
+    tracemalloc.start()
+    antes = tracemalloc.get_traced_memory()[0]
+    estrutura = fabrica()
+    for chave in chaves:
+        estrutura.insert(chave)
+    depois = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (depois - antes) / len(chaves)
+
+
+def comparar_memoria_abb():
+    N = 200_000
+    M = N
+    K = N // 10
+    random.seed(42)
+
+    chaves = gerar_aleatorio(N)
+
+    print("\n====================================")
+    print(f"ABB com objetos Node x ABB em arrays - dataset aleatorio (N={N})")
+    print("====================================")
+
+    for nome_estrutura, fabrica in (
+        ("ABB (Node)", lambda: ABBWrapper()),
+        ("ABB (arrays)", lambda: ABBArrayWrapper()),
+    ):
+        r = executar_benchmark_estrutura(
+            nome_estrutura=nome_estrutura,
+            fabrica=fabrica,
+            chaves_base=chaves,
+            m=M,
+            k=K,
+        )
+        r["bytes_por_chave"] = round(medir_bytes_por_chave(fabrica, chaves), 1)
+        imprimir_resultado(r)
+
+
+def medir_vazao_concorrente(tabela, chaves: list[int], threads: int, leitura: float, ops: int) -> float:
+    barreira = threading.Barrier(threads + 1)
+
+    def trabalhador(semente):
+        rng = random.Random(semente)
+        novas = [-(semente * ops + i + 1) for i in range(ops)]
+        sorteios = [rng.random() for _ in range(ops)]
+        buscas = [rng.choice(chaves) for _ in range(ops)]
+        barreira.wait()
+        inseridas = 0
+        for i in range(ops):
+            if sorteios[i] < leitura:
+                tabela.search(buscas[i])
+            elif inseridas and i % 2:
+                inseridas -= 1
+                tabela.remove(novas[inseridas])
+            else:
+                tabela.insert(novas[inseridas])
+                inseridas += 1
+
+    trabalhadores = [threading.Thread(target=trabalhador, args=(i,)) for i in range(threads)]
+    for t in trabalhadores:
+        t.start()
+    barreira.wait()
+    inicio = time.perf_counter()
+    for t in trabalhadores:
+        t.join()
+    return threads * ops / (time.perf_counter() - inicio)
+
+
+def comparar_concorrencia():
+    N = 50_000
+    OPS = 50_000
+    random.seed(42)
+
+    chaves = gerar_aleatorio(N)
+
+    print("\n====================================")
+    print(f"Vazão multi-thread: lock global x locks por faixa de buckets (N={N}, {OPS} ops/thread)")
+    print("====================================")
+
+    for leitura in (0.9, 0.5):
+        print(f"\nLeituras: {leitura:.0%} | escritas: {1 - leitura:.0%}")
+        for threads in (1, 2, 4, 8):
+            linha = []
+            for nome, fabrica in (
+                ("lock global", lambda: LockedHashTableChaining(size=N * 2)),
+                ("16 faixas", lambda: StripedHashTableChaining(size=N * 2, stripes=16)),
+            ):
+                tabela = fabrica()
+                for chave in chaves:
+                    tabela.insert(chave)
+                vazao = medir_vazao_concorrente(tabela, chaves, threads, leitura, OPS)
+                linha.append(f"{nome}: {vazao:>10,.0f} ops/s")
+            print(f"  {threads} thread(s) | " + " | ".join(linha))
+
+
+def medir_sondagens(tabela, chaves: list[int]) -> tuple[float, int]:
+    comprimentos = [tabela.probe_length(chave) for chave in chaves]
+    return sum(comprimentos) / len(comprimentos), max(comprimentos)
+
+
+def comparar_churn_enderecamento_aberto():
+    N = 2_000
+    PASSOS = 100_000
+    AMOSTRA = 500
+    random.seed(42)
+
+    chaves = gerar_aleatorio(N)
+    ausentes = [-(i + 1) for i in range(AMOSTRA)]
+
+    print("\n====================================")
+    print(f"Churn no endereçamento aberto: {PASSOS} remoções + inserções com {N} chaves vivas")
+    print("====================================")
+
+    for nome, opcoes in (
+        ("sem redimensionamento nem compactação", {"max_load_factor": None}),
+        ("crescimento + compactação (carga máx. 0.7)", {}),
+    ):
+        print(f"\nEstrutura: Hash (enderecamento aberto, linear) - {nome}")
+        tabela = OpenAddressHashTable(size=N * 2, method="linear", timing=False, **opcoes)
+        vivas = list(chaves)
+        for chave in vivas:
+            tabela.insert(chave)
+
+        rng = random.Random(7)
+        proxima = max(chaves) + 1
+        for passo in range(1, PASSOS + 1):
+            posicao = rng.randrange(N)
+            tabela.remove(vivas[posicao])
+            vivas[posicao] = proxima
+            tabela.insert(proxima)
+            proxima += rng.randint(1, 1_000)
+
+            if passo % (PASSOS // 5) == 0:
+                media, maximo = medir_sondagens(tabela, ausentes)
+                inicio = time.perf_counter()
+                for chave in ausentes:
+                    tabela.search(chave)
+                tempo = (time.perf_counter() - inicio) / AMOSTRA
+                print(
+                    f"  passo {passo:>7} | tamanho {tabela.size:>6} | removidas {tabela.tombstones:>5} | "
+                    f"sondagens (ausente) média {media:8.1f} máx {maximo:>5} | busca {tempo:.2e} s"
+                )
+        print(f"  Redimensionamentos: {tabela.resize_count} | compactações: {tabela.compaction_count}")
+
+
+def resumir_sondagens(comprimentos: list[int]) -> str:
+    comprimentos = sorted(comprimentos)
+    n = len(comprimentos)
+    media = sum(comprimentos) / n
+    variancia = sum((c - media) ** 2 for c in comprimentos) / n
+    p99 = comprimentos[min(n - 1, int(0.99 * n))]
+    return f"média {media:6.2f} var {variancia:8.2f} p99 {p99:>4} máx {comprimentos[-1]:>4}"
+
+
+def comparar_robin_hood():
+    TAMANHO = 10_007
+    AMOSTRA = 2_000
+    random.seed(42)
+
+    print("\n====================================")
+    print(f"Comprimento de sondagem por método e fator de carga (tabela com {TAMANHO} posições)")
+    print("====================================")
+
+    for carga in (0.5, 0.7, 0.8, 0.9, 0.95):
+        n = int(carga * TAMANHO)
+        chaves = gerar_aleatorio(n)
+        presentes = random.sample(chaves, min(AMOSTRA, n))
+        ausentes = [-(i + 1) for i in range(AMOSTRA)]
+
+        print(f"\nFator de carga {carga}:")
+        for metodo in ("linear", "quadratic", "double", "robinhood"):
+            tabela = OpenAddressHashTable(size=TAMANHO, method=metodo, timing=False, max_load_factor=None)
+            inicio = time.perf_counter()
+            inseridas = sum(tabela.insert(chave) for chave in chaves)
+            tempo_insercao = (time.perf_counter() - inicio) / n
+
+            inicio = time.perf_counter()
+            for chave in presentes:
+                tabela.search(chave)
+            tempo_acerto = (time.perf_counter() - inicio) / len(presentes)
+
+            inicio = time.perf_counter()
+            for chave in ausentes:
+                tabela.search(chave)
+            tempo_falha = (time.perf_counter() - inicio) / len(ausentes)
+
+            inicio = time.perf_counter()
+            for chave in presentes:
+                tabela.remove(chave)
+            tempo_remocao = (time.perf_counter() - inicio) / len(presentes)
+
+            tabela = OpenAddressHashTable(size=TAMANHO, method=metodo, timing=False, max_load_factor=None)
+            for chave in chaves:
+                tabela.insert(chave)
+            acertos = resumir_sondagens([tabela.probe_length(chave) for chave in presentes])
+            falhas = resumir_sondagens([tabela.probe_length(chave) for chave in ausentes])
+
+            aviso = "" if inseridas == n else f" ({n - inseridas} inserções falharam)"
+            print(f"  {metodo:<10} acerto : {acertos}{aviso}")
+            print(f"  {'':<10} falha  : {falhas}")
+            print(
+                f"  {'':<10} tempos: inserção {tempo_insercao:.2e} | busca com acerto {tempo_acerto:.2e} | "
+                f"busca com falha {tempo_falha:.2e} | remoção {tempo_remocao:.2e} s"
+            )
+
+
+def comparar_latencia_cuckoo():
+    N = 100_000
+    M = N
+    K = N // 10
+    random.seed(42)
+
+    chaves = gerar_aleatorio(N)
+
+    for carga in (0.5, 0.85):
+        tamanho = int(N / carga)
+
+        print("\n====================================")
+        print(f"Cauda da latência de busca - fator de carga {carga} (N={N}, M={M}, K={K})")
+        print("====================================")
+
+        for nome_estrutura, fabrica in (
+            *(
+                (
+                    f"Hash (enderecamento aberto, {metodo})",
+                    lambda m=metodo: HashOpenWrapper(size=tamanho, method=m, max_load_factor=None, timing=True),
+                )
+                for metodo in ("linear", "double", "robinhood")
+            ),
+            ("Hash (cuckoo, 2 funções)", lambda: CuckooWrapper(size=tamanho, timing=True, max_load_factor=0.5)),
+            ("Hash (cuckoo, 3 funções)", lambda: CuckooWrapper(size=tamanho, hashes=3, timing=True, max_load_factor=0.9)),
+        ):
+            wrapper = fabrica()
+
+            gc.disable()
+            try:
+                r = executar_benchmark_estrutura(
+                    nome_estrutura=nome_estrutura,
+                    fabrica=lambda: wrapper,
+                    chaves_base=chaves,
+                    m=M,
+                    k=K,
+                )
+            finally:
+                gc.enable()
+            imprimir_resultado(r)
+            print("  " + format_summary("busca", wrapper.table.search_latency.summary()))
+
+
+def buscar_sondagem_por_passo(tabela, chave) -> bool:
+    # Como a busca era feita antes das estratégias: método e hashes recalculados a cada tentativa
+    for i in range(tabela.size):
+        if tabela.method == "linear":
+            index = (tabela.hash1(chave) + i) % tabela.size
+        elif tabela.method == "quadratic":
+            index = (tabela.hash1(chave) + i * i) % tabela.size
+        elif tabela.method == "double":
+            index = (tabela.hash1(chave) + i * tabela.hash2(chave)) % tabela.size
+        slot = tabela.table[index]
+        if slot is None:
+            return False
+        if slot == chave:
+            return True
+    return False
+
+
+def comparar_estrategias_sondagem():
+    N = 70_000
+    random.seed(42)
+
+    chaves = gerar_aleatorio(N)
+    chaves_busca = montar_chaves_busca(chaves, N)
+
+    print("\n====================================")
+    print(f"Sondagem passo a passo x iterador da estratégia (N={N}, fator de carga 0.7, melhor de 3)")
+    print("====================================")
+
+    for metodo, tamanho in (
+        ("linear", 100_003),
+        ("quadratic", 100_003),
+        ("double", 100_003),
+        ("triangular", 1 << 17),
+    ):
+        tabela = OpenAddressHashTable(size=tamanho, method=metodo, timing=False, max_load_factor=None)
+        for chave in chaves:
+            tabela.insert(chave)
+
+        def medir(busca):
+            tempos = []
+            for _ in range(3):
+                inicio = time.perf_counter()
+                encontrados = [busca(chave) for chave in chaves_busca]
+                tempos.append((time.perf_counter() - inicio) / N)
+            return min(tempos), encontrados
+
+        tempo_iterador, encontrados = medir(tabela._search)
+
+        if metodo == "triangular":
+            print(f"  {metodo:<10} iterador {tempo_iterador:.2e} s/busca (estratégia registrada, tabela com {tamanho} posições)")
+            continue
+
+        tempo_por_passo, encontrados_antes = medir(lambda chave: buscar_sondagem_por_passo(tabela, chave))
+
+        assert encontrados == encontrados_antes
+        print(
+            f"  {metodo:<10} por passo {tempo_por_passo:.2e} s/busca | iterador {tempo_iterador:.2e} s/busca | "
+            f"ganho {tempo_por_passo / tempo_iterador:.2f}x"
+        )
+
+
+def comparar_entradas_duplicadas():
+    S = 200_000
+    random.seed(42)
+
+    print("\n====================================")
+    print(f"Fluxos com muitas chaves repetidas - endereçamento aberto (S={S} operações, 10% remoções)")
+    print("====================================")
+
+    def incrementar(valor):
+        return valor + 1
+
+    for distintas in (1_000, 20_000):
+        universo = gerar_aleatorio(distintas)
+        fluxo = [(random.random() < 0.1, random.choice(universo)) for _ in range(S)]
+
+        print(f"\n{distintas} chaves distintas ({1 - distintas / S:.1%} de repetição):")
+        for metodo in ("linear", "double", "robinhood"):
+            linha = []
+
+            tabela = OpenAddressHashTable(size=11, method=metodo, timing=False)
+            inicio = time.perf_counter()
+            for remover, chave in fluxo:
+                if remover:
+                    tabela.remove(chave)
+                elif not tabela.search(chave):
+                    tabela.insert(chave)
+            linha.append(f"search + insert {(time.perf_counter() - inicio) / S:.2e}")
+
+            tabela = OpenAddressHashTable(size=11, method=metodo, timing=False)
+            inicio = time.perf_counter()
+            for remover, chave in fluxo:
+                if remover:
+                    tabela.remove(chave)
+                else:
+                    tabela.insert(chave)
+            linha.append(f"insert {(time.perf_counter() - inicio) / S:.2e}")
+            chaves_finais = tabela.count
+
+            tabela = OpenAddressHashTable(size=11, method=metodo, timing=False)
+            inicio = time.perf_counter()
+            for remover, chave in fluxo:
+                if remover:
+                    tabela.remove(chave)
+                else:
+                    tabela.put(chave, tabela.get(chave, 0) + 1)
+            linha.append(f"get + put {(time.perf_counter() - inicio) / S:.2e}")
+
+            tabela = OpenAddressHashTable(size=11, method=metodo, timing=False)
+            inicio = time.perf_counter()
+            for remover, chave in fluxo:
+                if remover:
+                    tabela.remove(chave)
+                else:
+                    tabela.upsert(chave, 1, incrementar)
+            linha.append(f"upsert {(time.perf_counter() - inicio) / S:.2e}")
+
+            print(f"  {metodo:<10} " + " | ".join(linha) + f" s/op | chaves no fim: {chaves_finais} | tamanho: {tabela.size}")
+
+
+def comparar_funcoes_hash():
+    N = 50_000
+    random.seed(42)
+
+    conjuntos = {
+        "aleatorio": gerar_aleatorio(N),
+        "ordenado": gerar_ordenado(N),
+        "quase_ordenado": gerar_quase_ordenado(N),
+        "espacado_1024": gerar_espacado(N),
+    }
+    tabelas = (
+        ("encad. 2N+1", lambda f: HashTableChaining(size=2 * N + 1, timing=False, hash_function=f, seed=7)),
+        ("encad. pot. 2", lambda f: HashTableChaining(size=2 * N, timing=False, hash_function=f, seed=7, power_of_two=True)),
+        ("aberto linear pot. 2", lambda f: OpenAddressHashTable(size=2 * N, method="linear", timing=False, hash_function=f, seed=7, power_of_two=True)),
+    )
+
+    print("\n====================================")
+    print(f"Funções de hash x datasets (N={N}): colisões e tempo médio por operação (inserção + busca)")
+    print("====================================")
+
+    for nome_dataset, chaves in conjuntos.items():
+        chaves_busca = montar_chaves_busca(chaves, N)
+        print(f"\nDataset: {nome_dataset}")
+        for funcao in ("python", "fibonacci", "splitmix", "tabulation"):
+            linha = []
+            for nome_tabela, fabrica in tabelas:
+                tabela = fabrica(funcao)
+                inicio = time.perf_counter()
+                for chave in chaves:
+                    tabela.insert(chave)
+                for chave in chaves_busca:
+                    tabela.search(chave)
+                tempo = (time.perf_counter() - inicio) / (2 * N)
+                linha.append(f"{nome_tabela}: {tabela.collision_count:>7} col. {tempo:.2e} s")
+            print(f"  {funcao:<10} " + " | ".join(linha))
+
+
+def comparar_tabela_numpy():
+    import numpy as np
+    from hash_numpy import NumpyIntHashTable
+
+    N = 1_000_000
+    M = 1_000_000
+    random.seed(42)
+
+    chaves = gerar_aleatorio(N)
+    chaves_busca = montar_chaves_busca(chaves, M)
+
+    print("\n====================================")
+    print(f"Tabela NumPy (int64) vs tabela aberta por chave (N={N}, M={M})")
+    print("====================================")
+
+    tabela = OpenAddressHashTable(size=2 * N, method="linear", timing=False)
+    inicio = time.perf_counter()
+    for chave in chaves:
+        tabela.insert(chave)
+    tempo_insercao = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    encontrados = sum(map(tabela.search, chaves_busca))
+    tempo_busca = time.perf_counter() - inicio
+    print(f"{'aberto linear (por chave)':<28} inserção: {N / tempo_insercao:>12,.0f} chaves/s | busca: {M / tempo_busca:>12,.0f} buscas/s | encontradas: {encontrados}")
+
+    tabela = NumpyIntHashTable(size=2 * N)
+    inicio = time.perf_counter()
+    tabela.insert_many(chaves)
+    tempo_insercao = time.perf_counter() - inicio
+    lote = np.asarray(chaves_busca, dtype=np.int64)
+    inicio = time.perf_counter()
+    encontrados = int(tabela.search_many(lote).sum())
+    tempo_busca = time.perf_counter() - inicio
+    print(f"{'NumPy int64 (em lote)':<28} inserção: {N / tempo_insercao:>12,.0f} chaves/s | busca: {M / tempo_busca:>12,.0f} buscas/s | encontradas: {encontrados}")
+    print(f"Bytes por chave (NumPy): {tabela.report()['bytes_por_chave']}")
+
+
+def comparar_tabela_swiss():
+    CAPACIDADE = 1 << 17
+    M = 100_000
+    random.seed(42)
+
+    print("\n====================================")
+    print(f"Swiss table (grupos de 16 bytes de controle) vs aberto linear (capacidade={CAPACIDADE}, M={M} buscas)")
+    print("====================================")
+
+    for carga in (0.5, 0.75, 0.85):
+        n = int(carga * CAPACIDADE)
+        chaves = gerar_aleatorio(n)
+        chaves_busca = montar_chaves_busca(chaves, M)
+        presentes = chaves_busca[: M // 2]
+        ausentes = chaves_busca[M // 2 :]
+
+        print(f"\nFator de carga {carga}:")
+        for nome, tabela in (
+            ("aberto linear", OpenAddressHashTable(size=CAPACIDADE, method="linear", timing=False, max_load_factor=0.9)),
+            ("swiss", SwissHashTable(size=CAPACIDADE, timing=False, max_load_factor=0.9)),
+        ):
+            for chave in chaves:
+                tabela.insert(chave)
+            search = tabela.search
+
+            inicio = time.perf_counter()
+            for chave in presentes:
+                search(chave)
+            tempo_hit = (time.perf_counter() - inicio) / len(presentes)
+
+            inicio = time.perf_counter()
+            for chave in ausentes:
+                search(chave)
+            tempo_miss = (time.perf_counter() - inicio) / len(ausentes)
+
+            print(f"  {nome:<14} busca presente: {tempo_hit:.2e} s | busca ausente: {tempo_miss:.2e} s | tamanho: {tabela.size}")
+
+
+def comparar_filtro_negativas():
+    N = 100_000
+    M = 100_000
+    random.seed(42)
+
+    chaves = gerar_aleatorio(N)
+    chaves_busca = montar_chaves_busca(chaves, M)
+    presentes = chaves_busca[: M // 2]
+    ausentes = chaves_busca[M // 2 :]
+
+    def tabela_aberta():
+        return OpenAddressHashTable(size=2 * N, method="linear", timing=False)
+
+    def tabela_encadeada():
+        return HashTableChaining(size=2 * N + 1, timing=False)
+
+    estruturas = (
+        ("ABB", lambda: ABBWrapper(), lambda filtro: FilteredTree(abb, filtro)),
+        ("AVL", lambda: AVLWrapper(), lambda filtro: FilteredTree(avl, filtro)),
+        ("Hash aberto linear", tabela_aberta, lambda filtro: FilteredTable(tabela_aberta(), filtro)),
+        ("Hash encadeado", tabela_encadeada, lambda filtro: FilteredTable(tabela_encadeada(), filtro)),
+    )
+    filtros = (
+        ("sem filtro", None),
+        ("Bloom 1%", lambda: BloomFilter(N, 0.01, seed=7)),
+        ("Bloom contador 1%", lambda: CountingBloomFilter(N, 0.01, seed=7)),
+    )
+
+    print("\n====================================")
+    print(f"Filtro de Bloom na frente das estruturas (N={N}, {len(presentes)} buscas presentes, {len(ausentes)} ausentes)")
+    print("====================================")
+
+    for nome_estrutura, fabrica, fabrica_filtrada in estruturas:
+        print(f"\n{nome_estrutura}:")
+        for nome_filtro, fabrica_filtro in filtros:
+            if fabrica_filtro is None:
+                estrutura = fabrica()
+            else:
+                estrutura = fabrica_filtrada(fabrica_filtro())
+            for chave in chaves:
+                estrutura.insert(chave)
+
+            inicio = time.perf_counter()
+            for chave in presentes:
+                estrutura.search(chave)
+            tempo_hit = (time.perf_counter() - inicio) / len(presentes)
+
+            inicio = time.perf_counter()
+            for chave in ausentes:
+                estrutura.search(chave)
+            tempo_miss = (time.perf_counter() - inicio) / len(ausentes)
+
+            linha = (
+                f"  {nome_filtro:<18} presente: {tempo_hit:.2e} s | ausente: {tempo_miss:.2e} s"
+                f" | 90% ausentes: {0.1 * tempo_hit + 0.9 * tempo_miss:.2e} s"
+            )
+            if fabrica_filtro is not None:
+                taxa_fp = estrutura.false_positives / len(ausentes)
+                bytes_por_chave = estrutura.bloom.memory_bytes() / N
+                linha += f" | FP: {taxa_fp:.4f} | filtro: {bytes_por_chave:.2f} bytes/chave"
+            print(linha)
+
+
+def comparar_snapshot_mmap():
+    N = 300_000
+    M = 100_000
+    random.seed(42)
+
+    chaves = gerar_aleatorio(N)
+    chaves_busca = montar_chaves_busca(chaves, M)
+    pasta = tempfile.mkdtemp()
+
+    def reconstruir_aberto():
+        tabela = OpenAddressHashTable(size=11, method="linear", timing=False)
+        for chave in chaves:
+            tabela.insert(chave)
+        return tabela
+
+    def reconstruir_encadeado():
+        tabela = HashTableChaining(size=11, timing=False, incremental=False)
+        for chave in chaves:
+            tabela.insert(chave)
+        return tabela
+
+    def reconstruir_avl():
+        raiz = None
+        for chave in chaves:
+            raiz = avl.insert(raiz, chave)
+        return raiz
+
+    casos = (
+        ("Hash aberto", reconstruir_aberto, lambda t: t.keys(), write_hash_snapshot, lambda t: t.search),
+        ("Hash encadeado", reconstruir_encadeado, lambda t: t.keys(), write_hash_snapshot, lambda t: t.search),
+        ("AVL", reconstruir_avl, avl.iter_inorder, write_sorted_snapshot, lambda r: lambda k: avl.search(r, k) is not None),
+    )
+
+    print("\n====================================")
+    print(f"Partida a frio: reconstruir inserindo vs abrir snapshot com mmap (N={N}, M={M} buscas)")
+    print("====================================")
+
+    try:
+        for nome, reconstruir, listar_chaves, escrever, buscador in casos:
+            inicio = time.perf_counter()
+            estrutura = reconstruir()
+            tempo_reconstrucao = time.perf_counter() - inicio
+
+            search = buscador(estrutura)
+            inicio = time.perf_counter()
+            for chave in chaves_busca:
+                search(chave)
+            tempo_busca = (time.perf_counter() - inicio) / M
+
+            caminho = os.path.join(pasta, "estrutura.snap")
+            inicio = time.perf_counter()
+            escrever(caminho, listar_chaves(estrutura))
+            tempo_escrita = time.perf_counter() - inicio
+            del estrutura, search
+
+            inicio = time.perf_counter()
+            snapshot = open_snapshot(caminho)
+            tempo_abertura = time.perf_counter() - inicio
+
+            inicio = time.perf_counter()
+            for chave in chaves_busca:
+                snapshot.search(chave)
+            tempo_busca_snapshot = (time.perf_counter() - inicio) / M
+            tamanho_arquivo = snapshot.memory_bytes()
+            snapshot.close()
+            os.remove(caminho)
+
+            print(f"\n{nome}:")
+            print(f"  Reconstrução por inserção: {tempo_reconstrucao:.3f} s | busca: {tempo_busca:.2e} s")
+            print(f"  Escrita do snapshot      : {tempo_escrita:.3f} s | arquivo: {tamanho_arquivo / N:.1f} bytes/chave")
+            print(f"  Abertura com mmap        : {tempo_abertura * 1000:.3f} ms | busca no mapa: {tempo_busca_snapshot:.2e} s")
+    finally:
+        os.rmdir(pasta)
+
+
+_ESTRUTURA_PROCESSO = None
+
+
+def medir_memoria_processo() -> dict:
+    memoria = {}
+    try:
+        with open("/proc/self/smaps_rollup") as arquivo:
+            for linha in arquivo:
+                campo, _, valor = linha.partition(":")
+                if campo in ("Pss", "Private_Clean", "Private_Dirty"):
+                    memoria[campo] = int(valor.split()[0])
+    except OSError:
+        return {}
+    return {
+        "pss_kb": memoria["Pss"],
+        "privada_kb": memoria["Private_Clean"] + memoria["Private_Dirty"],
+    }
+
+
+def _iniciar_copia_processo(chaves: list[int]) -> None:
+    global _ESTRUTURA_PROCESSO
+    tabela = OpenAddressHashTable(size=2 * len(chaves), method="linear", timing=False)
+    for chave in chaves:
+        tabela.insert(chave)
+    _ESTRUTURA_PROCESSO = tabela
+
+
+def _iniciar_leitor_processo(nome: str) -> None:
+    global _ESTRUTURA_PROCESSO
+    _ESTRUTURA_PROCESSO = SharedTableReader(nome)
+
+
+def _buscar_no_processo(chaves_busca: list[int]) -> dict:
+    estrutura = _ESTRUTURA_PROCESSO
+    geracao = None
+    if isinstance(estrutura, SharedTableReader):
+        estrutura.refresh()
+        geracao = estrutura.generation
+
+    search = estrutura.search
+    inicio = time.perf_counter()
+    for chave in chaves_busca:
+        search(chave)
+    resultado = {
+        "pid": os.getpid(),
+        "vazao": len(chaves_busca) / (time.perf_counter() - inicio),
+        "geracao": geracao,
+    }
+    resultado.update(medir_memoria_processo())
+    return resultado
+
+
+def comparar_memoria_compartilhada():
+    N = 500_000
+    M = 100_000
+    random.seed(42)
+
+    chaves = gerar_aleatorio(N)
+    chaves_busca = montar_chaves_busca(chaves, M)
+
+    print("\n====================================")
+    print(f"Pool de processos: cópia da tabela por processo x tabela em memória compartilhada (N={N}, {M} buscas/processo)")
+    print("====================================")
+
+    def relatar(nome, resultados):
+        vazoes = ", ".join(f"{r['vazao']:,.0f}" for r in resultados)
+        linha = f"  {nome:<24} buscas/s por processo: {vazoes}"
+        if "pss_kb" in resultados[0]:
+            pss_total = sum(r["pss_kb"] for r in resultados) / 1024
+            privada = max(r["privada_kb"] for r in resultados) / 1024
+            linha += f" | PSS total: {pss_total:.1f} MB | privada máx.: {privada:.1f} MB"
+        geracoes = {r["geracao"] for r in resultados if r["geracao"] is not None}
+        if geracoes:
+            linha += f" | geração: {sorted(geracoes)}"
+        print(linha)
+
+    with SharedTablePublisher() as publicador:
+        publicador.publish(chaves)
+        for processos in (1, 2, 4):
+            print(f"\n{processos} processo(s):")
+
+            with ProcessPoolExecutor(processos, initializer=_iniciar_copia_processo, initargs=(chaves,)) as pool:
+                relatar("cópia por processo", list(pool.map(_buscar_no_processo, [chaves_busca] * processos)))
+
+            with ProcessPoolExecutor(processos, initializer=_iniciar_leitor_processo, initargs=(publicador.name,)) as pool:
+                relatar("memória compartilhada", list(pool.map(_buscar_no_processo, [chaves_busca] * processos)))
+                publicador.publish(chaves[: N // 2])
+                relatar("após troca de geração", list(pool.map(_buscar_no_processo, [chaves_busca] * processos)))
+            publicador.publish(chaves)
+
+
+EXPERIMENTOS = {
+    "principal": main,
+    "abb_iterativa": comparar_abb_recursiva_iterativa,
+    "carga_em_lote": comparar_carga_em_lote,
+    "memoria_abb": comparar_memoria_abb,
+    "avl_iterativa": comparar_avl_recursiva_iterativa,
+    "conjuntos_avl": comparar_conjuntos_avl,
+    "rehash": comparar_rehash_incremental,
+    "tracing": comparar_custo_tracing,
+    "lote": comparar_operacoes_em_lote,
+    "colisoes": comparar_ataque_colisoes,
+    "concorrencia": comparar_concorrencia,
+    "churn": comparar_churn_enderecamento_aberto,
+    "robin_hood": comparar_robin_hood,
+    "cuckoo": comparar_latencia_cuckoo,
+    "sondagem": comparar_estrategias_sondagem,
+    "duplicatas": comparar_entradas_duplicadas,
+    "funcoes_hash": comparar_funcoes_hash,
+    "numpy": comparar_tabela_numpy,
+    "swiss": comparar_tabela_swiss,
+    "filtro_bloom": comparar_filtro_negativas,
+    "snapshot": comparar_snapshot_mmap,
+    "memoria_compartilhada": comparar_memoria_compartilhada,
+}
+
+
 if __name__ == "__main__":
-    main()
+    experimento = sys.argv[1] if len(sys.argv) > 1 else "principal"
+    EXPERIMENTOS[experimento]()
@@ -0,0 +1,255 @@
+import math
+import random
+
+MASK32 = (1 << 32) - 1
+MIX128 = 0x9E3779B97F4A7C15F39CC0605CEDC835
+_MISSING = object()
+
+
+def optimal_parameters(capacity, fp_rate):
+    size = max(8, math.ceil(-capacity * math.log(fp_rate) / math.log(2) ** 2))
+    hashes = max(1, round(size / max(1, capacity) * math.log(2)))
+    return size, hashes
+
+
+class BloomFilter:
+    def __init__(self, capacity, fp_rate=0.01, seed=None):
+        self.size, self.hashes = optimal_parameters(capacity, fp_rate)
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+        self.stale_removals = 0
+        self.seed = random.Random(seed).getrandbits(64)
+
+    def _hashes(self, key):
+        h = (hash(key) ^ self.seed) * MIX128 >> 64
+        return h & MASK32, (h >> 32) | 1
+
+    def _positions(self, key):
+        h1, h2 = self._hashes(key)
+        size = self.size
+        return [(h1 + i * h2) % size for i in range(self.hashes)]
+
+    def add(self, key):
+        bits = self.bits
+        for index in self._positions(key):
+            bits[index >> 3] |= 1 << (index & 7)
+        self.count += 1
+
+    def remove(self, key):
+        self.stale_removals += 1
+
+    def __contains__(self, key):
+        h1, h2 = self._hashes(key)
+        size = self.size
+        bits = self.bits
+        for i in range(self.hashes):
+            index = (h1 + i * h2) % size
+            if not bits[index >> 3] & (1 << (index & 7)):
+                return False
+        return True
+
+    def memory_bytes(self):
+        return len(self.bits)
+
+    def expected_fp_rate(self):
+        return (1 - math.exp(-self.hashes * self.count / self.size)) ** self.hashes
+
+    def report(self):
+        return {
+            "posicoes_filtro": self.size,
+            "funcoes_hash_filtro": self.hashes,
+            "bytes_filtro": self.memory_bytes(),
+            "taxa_fp_esperada": round(self.expected_fp_rate(), 5),
+            "remocoes_sem_efeito": self.stale_removals,
+        }
+
+
+class CountingBloomFilter(BloomFilter):
+    def __init__(self, capacity, fp_rate=0.01, seed=None):
+        super().__init__(capacity, fp_rate, seed)
+        self.bits = None
+        self.counters = bytearray(self.size)
+
+    def add(self, key):
+        counters = self.counters
+        for index in self._positions(key):
+            if counters[index] < 255:
+                counters[index] += 1
+        self.count += 1
+
+    def remove(self, key):
+        counters = self.counters
+        positions = self._positions(key)
+        for index in positions:
+            if not counters[index]:
+                self.stale_removals += 1
+                return False
+        for index in positions:
+            if counters[index] < 255:
+                counters[index] -= 1
+        self.count -= 1
+        return True
+
+    def __contains__(self, key):
+        h1, h2 = self._hashes(key)
+        size = self.size
+        counters = self.counters
+        for i in range(self.hashes):
+            if not counters[(h1 + i * h2) % size]:
+                return False
+        return True
+
+    def memory_bytes(self):
+        return len(self.counters)
+
+
+class _BloomGuard:
+    def __init__(self, bloom):
+        self.bloom = bloom
+        self.skipped = 0
+        self.false_positives = 0
+
+    def _may_contain(self, key):
+        if key in self.bloom:
+            return True
+        self.skipped += 1
+        return False
+
+    def __contains__(self, key):
+        return self.search(key)
+
+    def report(self):
+        report = self.bloom.report()
+        report["descartes_filtro"] = self.skipped
+        report["falsos_positivos"] = self.false_positives
+        return report
+
+
+class FilteredTable(_BloomGuard):
+    def __init__(self, table, bloom):
+        super().__init__(bloom)
+        self.table = table
+
+    def insert(self, key):
+        inserted = self.table.insert(key)
+        if inserted:
+            self.bloom.add(key)
+        return inserted
+
+    def put(self, key, value):
+        inserted = self.table.put(key, value)
+        if inserted:
+            self.bloom.add(key)
+        return inserted
+
+    def search(self, key):
+        if not self._may_contain(key):
+            return False
+        found = self.table.search(key)
+        if not found:
+            self.false_positives += 1
+        return found
+
+    def get(self, key, default=None):
+        if not self._may_contain(key):
+            return default
+        value = self.table.get(key, _MISSING)
+        if value is _MISSING:
+            self.false_positives += 1
+            return default
+        return value
+
+    def remove(self, key):
+        if not self._may_contain(key):
+            return False
+        removed = self.table.remove(key)
+        if removed:
+            self.bloom.remove(key)
+        else:
+            self.false_positives += 1
+        return removed
+
+    def pop(self, key, default=_MISSING):
+        if self._may_contain(key):
+            value = self.table.pop(key, _MISSING)
+            if value is not _MISSING:
+                self.bloom.remove(key)
+                return value
+            self.false_positives += 1
+        if default is _MISSING:
+            raise KeyError(key)
+        return default
+
+    def __len__(self):
+        return len(self.table)
+
+    def report(self):
+        report = self.table.report()
+        report.update(super().report())
+        return report
+
+
+class FilteredTree(_BloomGuard):
+    def __init__(self, tree, bloom):
+        super().__init__(bloom)
+        self.tree = tree
+        self.root = None
+        self.count = 0
+
+    def insert(self, key):
+        if key in self.bloom and self.tree.search(self.root, key) is not None:
+            return False
+        self.root = self.tree.insert(self.root, key)
+        self.bloom.add(key)
+        self.count += 1
+        return True
+
+    def search(self, key):
+        if not self._may_contain(key):
+            return False
+        if self.tree.search(self.root, key) is None:
+            self.false_positives += 1
+            return False
+        return True
+
+    def remove(self, key):
+        if not self.search(key):
+            return False
+        self.root = self.tree.delete(self.root, key)
+        self.bloom.remove(key)
+        self.count -= 1
+        return True
+
+    def __len__(self):
+        return self.count
+
+    def report(self):
+        report = super().report()
+        report["altura"] = self.tree.height(self.root)
+        return report
+
+
+if __name__ == "__main__":
+    filtro = CountingBloomFilter(capacity=1000, fp_rate=0.01, seed=1)
+    for chave in range(0, 2000, 2):
+        filtro.add(chave)
+
+    falsos = sum(chave in filtro for chave in range(1, 2000, 2))
+    print(f"Falsos positivos: {falsos}/1000 (esperado ~{filtro.expected_fp_rate():.3f})")
+    print("10 no filtro:", 10 in filtro)
+    filtro.remove(10)
+    print("10 no filtro após remoção:", 10 in filtro)
+    print("Relatório:", filtro.report())
+
+    import avl
+    from hash_open import OpenAddressHashTable
+
+    tabela = FilteredTable(OpenAddressHashTable(size=11, timing=False), CountingBloomFilter(100, seed=1))
+    arvore = FilteredTree(avl, BloomFilter(100, seed=1))
+    for chave in (10, 17, 21, 32, 43, 54):
+        tabela.insert(chave)
+        arvore.insert(chave)
+    tabela.remove(32)
+    arvore.remove(32)
+    print("Tabela com filtro: 21:", 21 in tabela, "| 32:", 32 in tabela, "| 99:", 99 in tabela, "| descartes:", tabela.skipped)
+    print("AVL com filtro: 21:", 21 in arvore, "| 32:", 32 in arvore, "| falsos positivos:", arvore.false_positives)
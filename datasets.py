@@ -1,5 +1,6 @@
 
 import random
+import sys
 
 
 def gerar_aleatorio(n, minimo=1, maximo=1_000_000_000):
@@ -12,6 +13,10 @@ def gerar_ordenado(n, minimo=1, maximo=1_000_000_000):
     return chaves
 
 
+def gerar_espacado(n, passo=1024, minimo=1):
+    return [minimo + i * passo for i in range(n)]
+
+
 def gerar_quase_ordenado(
     n,
     minimo=1,
@@ -51,3 +56,12 @@ def montar_chaves_busca(
             ausentes.append(candidato)
 
     return presentes + ausentes
+
+
+def gerar_colisoes(n, grupos=1, minimo=1, maximo=1_000_000_000):
+    modulo = sys.hash_info.modulus
+    alvos = random.sample(range(minimo, maximo), grupos)
+
+    chaves = [alvos[i % grupos] + (i // grupos) * modulo for i in range(n)]
+    random.shuffle(chaves)
+    return chaves
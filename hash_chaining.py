@@ -1,116 +1,682 @@
 import time
 
+from latency import LatencyHistogram, format_summary
+from tracing import make_trace
+from hashing import make_hash_function, next_power_of_two
+import avl
+
+TRACE_MESSAGES = {
+    "insert_old_duplicate": "[INSERIR] A chave {key} já estava na tabela antiga (em redimensionamento)",
+    "insert_start": (
+        "[INSERIR] Quero guardar a chave {key}\n"
+        "Ela caiu na posição {index} da tabela\n"
+        "Conteúdo dessa posição ANTES: {bucket}"
+    ),
+    "insert_duplicate": "Essa chave já estava na tabela",
+    "insert_collision": "Já tinha chave nessa posição, ocorre uma colisão",
+    "insert_done": "Valor dessa posição DEPOIS: {bucket}",
+    "search_old_found": "[BUSCAR] Chave {key} encontrada na tabela antiga (em redimensionamento)",
+    "search_start": (
+        "[BUSCAR] Quero saber se a chave {key} está na tabela\n"
+        "Ela deveria estar na posição {index}.\n"
+        "Conteúdo dessa posição: {bucket}"
+    ),
+    "compare": "Comparando com {element}...",
+    "search_found": "Chave encontrada nessa posição.",
+    "search_missing": "Chave não encontrada na tabela.",
+    "remove_old": "[REMOVER] Chave {key} removida da tabela antiga (em redimensionamento)",
+    "remove_start": (
+        "[REMOVER] Quero remover a chave {key}\n"
+        "Espera-se que esteja na posição {index}\n"
+        "Conteúdo da posição antes: {bucket}"
+    ),
+    "remove_done": "Chave encontrada e removida\nConteúdo dessa posição DEPOIS: {bucket}",
+    "remove_missing": "Chave não encontrada, nada foi removido.",
+    "resize": "Fator de carga {load:.2f}: redimensionando de {old_size} para {new_size} posições",
+    "rehash_done": "Redimensionamento concluído",
+    "treeify": "Posição {index} passou a guardar {count} chaves: a lista virou uma árvore AVL",
+    "untreeify": "Posição {index} voltou a ter {count} chaves: a árvore AVL virou lista de novo",
+    "search_tree": "Essa posição é uma árvore AVL com {count} chaves, busca em O(log n)",
+}
+
+_MISSING = object()
+
+
+class UnorderableBucket(list):
+    pass
+
+
+class TreeBucket:
+    def __init__(self, items):
+        items = sorted(items, key=lambda item: item[0])
+        self.root = avl.build_from_sorted(
+            [key for key, _ in items], values=[value for _, value in items]
+        )
+        self.count = len(items)
+
+    def _node(self, key):
+        try:
+            return avl.search(self.root, key)
+        except TypeError:
+            return None
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, key):
+        return self._node(key) is not None
+
+    def __iter__(self):
+        return avl.iter_inorder(self.root)
+
+    def __repr__(self):
+        return f"AVL{list(self)}"
+
+    def items(self):
+        for node in avl.iter_nodes(self.root):
+            yield node.key, node.value
+
+    def get(self, key, default=None):
+        node = self._node(key)
+        return default if node is None else node.value
+
+    def put(self, key, value, overwrite):
+        node = self._node(key)
+        if node is not None:
+            if overwrite:
+                node.value = value
+            return False
+        self.root = avl.insert(self.root, key, value=value)
+        self.count += 1
+        return True
+
+    def pop(self, key):
+        node = self._node(key)
+        if node is None:
+            return False, None
+        value = node.value
+        self.root = avl.delete(self.root, key)
+        self.count -= 1
+        return True, value
+
+
+def _bucket_items(bucket, bucket_values):
+    if type(bucket) is TreeBucket:
+        return bucket.items()
+    return zip(bucket, bucket_values)
+
+
 class HashTableChaining:
-    def __init__(self, size=11, debug=False):
+    def __init__(
+        self,
+        size=11,
+        debug=False,
+        trace_sink=None,
+        timing=True,
+        max_load_factor=1.0,
+        min_load_factor=0.25,
+        incremental=True,
+        rehash_step=4,
+        treeify_threshold=8,
+        untreeify_threshold=6,
+        hash_function="python",
+        seed=None,
+        power_of_two=False,
+    ):
+        self.power_of_two = power_of_two
+        if power_of_two:
+            size = next_power_of_two(size)
+        self.hash_function = make_hash_function(hash_function, seed)
+
         self.size = size
-        self.table = [[] for _ in range(size)]
+        self.table = [None] * size
+        self.values = [None] * size
         self.count = 0
 
+        self.initial_size = size
+        self.max_load_factor = max_load_factor
+        self.min_load_factor = min_load_factor
+        self.incremental = incremental
+        self.rehash_step = rehash_step
+        self.resize_count = 0
+
+        self.treeify_threshold = treeify_threshold
+        self.untreeify_threshold = untreeify_threshold
+        self.treeify_count = 0
+
+        self._old_table = None
+        self._old_values = None
+        self._old_size = 0
+        self._rehash_index = 0
+
         self.collision_count = 0
-        self.insert_times = []
-        self.search_times = []
-        self.remove_times = []
+        self.timing = timing
+        self.insert_latency = LatencyHistogram()
+        self.search_latency = LatencyHistogram()
+        self.remove_latency = LatencyHistogram()
 
         self.debug = debug
+        self._trace = make_trace(TRACE_MESSAGES, debug, trace_sink)
 
-    def _log(self, msg: str):
-        if self.debug:
-            print(msg)
+    def _index_for(self, key, size):
+        h = self.hash_function(key)
+        if self.power_of_two:
+            return h & (size - 1)
+        return h % size
 
     def _hash(self, key):
-        return hash(key) % self.size
+        return self._index_for(key, self.size)
+
+    def _grow_size(self, size):
+        if self.power_of_two:
+            return 2 * size
+        return 2 * size + 1
 
     def load_factor(self):
         if self.size == 0:
             return 0.0
         return self.count / self.size
 
-    def insert(self, key):
-        start = time.perf_counter()
+    def is_rehashing(self):
+        return self._old_table is not None
+
+    def _old_index(self, key):
+        if self._old_table is None:
+            return -1
+        index = self._index_for(key, self._old_size)
+        if index < self._rehash_index or not self._old_table[index]:
+            return -1
+        return index
+
+    def _treeify(self, table, values, index):
+        bucket = table[index]
+        if type(bucket) is UnorderableBucket:
+            return
+        try:
+            table[index] = TreeBucket(zip(bucket, values[index]))
+        except TypeError:
+            table[index] = UnorderableBucket(bucket)
+            return
+        values[index] = None
+        self.treeify_count += 1
+        if self._trace is not None:
+            self._trace("treeify", index=index, count=len(bucket))
+
+    def _untreeify(self, table, values, index, bucket_type=list):
+        bucket = table[index]
+        keys = bucket_type()
+        bucket_values = []
+        for key, value in bucket.items():
+            keys.append(key)
+            bucket_values.append(value)
+        table[index] = keys
+        values[index] = bucket_values
+        if self._trace is not None:
+            self._trace("untreeify", index=index, count=len(keys))
+
+    def _bucket_find(self, table, values, index, key):
+        bucket = table[index]
+        if not bucket:
+            return False, None
+        if type(bucket) is TreeBucket:
+            node = bucket._node(key)
+            if node is None:
+                return False, None
+            return True, node.value
+        try:
+            return True, values[index][bucket.index(key)]
+        except ValueError:
+            return False, None
+
+    def _bucket_put(self, table, values, index, key, value, overwrite):
+        bucket = table[index]
+        if bucket is None:
+            table[index] = [key]
+            values[index] = [value]
+            return True
+
+        if type(bucket) is TreeBucket:
+            try:
+                inserted = bucket.put(key, value, overwrite)
+            except TypeError:
+                self._untreeify(table, values, index, UnorderableBucket)
+                return self._bucket_put(table, values, index, key, value, overwrite)
+            if inserted:
+                self.collision_count += 1
+            return inserted
+
+        try:
+            position = bucket.index(key)
+        except ValueError:
+            pass
+        else:
+            if overwrite:
+                values[index][position] = value
+            return False
 
-        index = self._hash(key)
-        bucket = self.table[index]
+        if bucket:
+            self.collision_count += 1
+        bucket.append(key)
+        values[index].append(value)
+        if self.treeify_threshold is not None and len(bucket) >= self.treeify_threshold:
+            self._treeify(table, values, index)
+        return True
 
-        self._log(f"[INSERIR] Quero guardar a chave {key}")
-        self._log(f"Ela caiu na posição {index} da tabela")
-        self._log(f"Conteúdo dessa posição ANTES: {bucket}")
+    def _bucket_pop(self, table, values, index, key):
+        bucket = table[index]
+        if not bucket:
+            return False, None
+
+        if type(bucket) is TreeBucket:
+            found, value = bucket.pop(key)
+            if found and len(bucket) <= self.untreeify_threshold:
+                self._untreeify(table, values, index)
+            return found, value
+
+        try:
+            position = bucket.index(key)
+        except ValueError:
+            return False, None
+        del bucket[position]
+        return True, values[index].pop(position)
+
+    def _rehash_buckets(self, limit):
+        old_table = self._old_table
+        old_values = self._old_values
+        table = self.table
+        values = self.values
+        size = self.size
+        index_for = self._index_for
+        moved = 0
+        empty_visits = 0
+
+        while self._rehash_index < self._old_size and moved < limit:
+            bucket = old_table[self._rehash_index]
+            if bucket:
+                for key, value in _bucket_items(bucket, old_values[self._rehash_index]):
+                    index = index_for(key, size)
+                    target = table[index]
+                    if target is None:
+                        table[index] = [key]
+                        values[index] = [value]
+                    elif type(target) is TreeBucket:
+                        try:
+                            target.put(key, value, False)
+                        except TypeError:
+                            self._untreeify(table, values, index, UnorderableBucket)
+                            table[index].append(key)
+                            values[index].append(value)
+                    else:
+                        target.append(key)
+                        values[index].append(value)
+                        if (
+                            self.treeify_threshold is not None
+                            and len(target) >= self.treeify_threshold
+                        ):
+                            self._treeify(table, values, index)
+                old_table[self._rehash_index] = None
+                old_values[self._rehash_index] = None
+                moved += 1
+            else:
+                empty_visits += 1
+                if empty_visits >= limit * 10:
+                    self._rehash_index += 1
+                    break
+            self._rehash_index += 1
+
+        if self._rehash_index >= self._old_size:
+            self._old_table = None
+            self._old_values = None
+            if self._trace is not None:
+                self._trace("rehash_done")
+
+    def _finish_rehash(self):
+        while self._old_table is not None:
+            self._rehash_buckets(self._old_size)
+
+    def _resize(self, new_size):
+        self._finish_rehash()
+        if self._trace is not None:
+            self._trace(
+                "resize",
+                load=self.load_factor(),
+                old_size=self.size,
+                new_size=new_size,
+            )
+
+        self._old_table = self.table
+        self._old_values = self.values
+        self._old_size = self.size
+        self._rehash_index = 0
+        self.table = [None] * new_size
+        self.values = [None] * new_size
+        self.size = new_size
+        self.resize_count += 1
+
+        if not self.incremental:
+            self._finish_rehash()
+
+    def _check_grow(self):
+        if (
+            self.max_load_factor is not None
+            and self._old_table is None
+            and self.count > self.max_load_factor * self.size
+        ):
+            self._resize(self._grow_size(self.size))
+
+    def _check_shrink(self):
+        if (
+            self.min_load_factor is not None
+            and self._old_table is None
+            and self.size > self.initial_size
+            and self.count < self.min_load_factor * self.size
+        ):
+            self._resize(max(self.initial_size, self.size // 2))
+
+    def _insert(self, key, value=None, overwrite=False):
+        trace = self._trace
+        if self._old_table is not None:
+            self._rehash_buckets(self.rehash_step)
+
+        old_index = self._old_index(key)
+        if old_index >= 0 and key in self._old_table[old_index]:
+            if overwrite:
+                self._bucket_put(self._old_table, self._old_values, old_index, key, value, True)
+            if trace is not None:
+                trace("insert_old_duplicate", key=key)
+            return False
 
-        for existing in bucket:
-            if existing == key:
-                self._log("Essa chave já estava na tabela")
-                self.insert_times.append(time.perf_counter() - start)
+        index = self._hash(key)
+        table = self.table
+        bucket = table[index]
+
+        if trace is None:
+            if bucket is None:
+                table[index] = [key]
+                self.values[index] = [value]
+            elif not self._bucket_put(table, self.values, index, key, value, overwrite):
                 return False
+            self.count += 1
+            self._check_grow()
+            return True
+
+        trace("insert_start", key=key, index=index, bucket=list(bucket or []))
+
+        if bucket is not None and key in bucket:
+            self._bucket_put(table, self.values, index, key, value, overwrite)
+            trace("insert_duplicate")
+            return False
 
         if bucket:
-            self.collision_count += 1
-            self._log("Já tinha chave nessa posição, ocorre uma colisão")
+            trace("insert_collision")
 
-        bucket.append(key)
+        self._bucket_put(table, self.values, index, key, value, overwrite)
         self.count += 1
+        self._check_grow()
 
-        self.insert_times.append(time.perf_counter() - start)
-
-        self._log(f"Valor dessa posição DEPOIS: {bucket}")
+        trace("insert_done", bucket=list(table[index] or []))
         return True
 
-    def search(self, key):
-        start = time.perf_counter()
+    def _search(self, key):
+        trace = self._trace
+        if self._old_table is not None:
+            self._rehash_buckets(self.rehash_step)
+
+        old_index = self._old_index(key)
+        if old_index >= 0 and key in self._old_table[old_index]:
+            if trace is not None:
+                trace("search_old_found", key=key)
+            return True
 
         index = self._hash(key)
         bucket = self.table[index]
 
-        self._log(f"[BUSCAR] Quero saber se a chave {key} está na tabela")
-        self._log(f"Ela deveria estar na posição {index}.")
-        self._log(f"Conteúdo dessa posição: {bucket}")
+        if trace is None:
+            return bucket is not None and key in bucket
+
+        bucket = bucket or []
+        trace("search_start", key=key, index=index, bucket=list(bucket))
+        if type(bucket) is TreeBucket:
+            trace("search_tree", count=len(bucket))
+            found = key in bucket
+            trace("search_found" if found else "search_missing")
+            return found
 
         for element in bucket:
-            self._log(f"Comparando com {element}...")
+            trace("compare", element=element)
             if element == key:
-                self.search_times.append(time.perf_counter() - start)
-                self._log("Chave encontrada nessa posição.")
+                trace("search_found")
                 return True
 
-        self.search_times.append(time.perf_counter() - start)
-        self._log("Chave não encontrada na tabela.")
+        trace("search_missing")
         return False
 
-    def remove(self, key):
-        start = time.perf_counter()
+    def _get(self, key, default=None):
+        if self._old_table is not None:
+            self._rehash_buckets(self.rehash_step)
 
-        index = self._hash(key)
-        bucket = self.table[index]
+            old_index = self._old_index(key)
+            if old_index >= 0:
+                found, value = self._bucket_find(self._old_table, self._old_values, old_index, key)
+                if found:
+                    return value
 
-        self._log(f"[REMOVER] Quero remover a chave {key}")
-        self._log(f"Espera-se que esteja na posição {index}")
-        self._log(f"Conteúdo da posição antes: {bucket}")
+        found, value = self._bucket_find(self.table, self.values, self._hash(key), key)
+        return value if found else default
 
-        for i, element in enumerate(bucket):
-            self._log(f"Comparando com {element}...")
-            if element == key:
-                del bucket[i]
+    def _pop(self, key):
+        trace = self._trace
+        if self._old_table is not None:
+            self._rehash_buckets(self.rehash_step)
+
+        old_index = self._old_index(key)
+        if old_index >= 0:
+            found, value = self._bucket_pop(self._old_table, self._old_values, old_index, key)
+            if found:
                 self.count -= 1
-                self.remove_times.append(time.perf_counter() - start)
-                self._log("Chave encontrada e removida")
-                self._log(f"Conteúdo dessa posição DEPOIS: {bucket}")
-                return True
+                if trace is not None:
+                    trace("remove_old", key=key)
+                self._check_shrink()
+                return True, value
 
-        self.remove_times.append(time.perf_counter() - start)
-        self._log("Chave não encontrada, nada foi removido.")
-        return False
+        index = self._hash(key)
+        bucket = self.table[index] or []
 
-    def report(self):
-        def avg(lst):
-            return sum(lst) / len(lst) if lst else 0.0
+        if trace is not None:
+            trace("remove_start", key=key, index=index, bucket=list(bucket))
+            if type(bucket) is TreeBucket:
+                trace("search_tree", count=len(bucket))
+            else:
+                for element in bucket:
+                    trace("compare", element=element)
+                    if element == key:
+                        break
+
+        found, value = self._bucket_pop(self.table, self.values, index, key)
+        if not found:
+            if trace is not None:
+                trace("remove_missing")
+            return False, None
+
+        self.count -= 1
+        if trace is not None:
+            trace("remove_done", bucket=list(self.table[index] or []))
+        self._check_shrink()
+        return True, value
+
+    def _remove(self, key):
+        return self._pop(key)[0]
 
+    def insert(self, key):
+        if not self.timing:
+            return self._insert(key)
+        start = time.perf_counter()
+        result = self._insert(key)
+        self.insert_latency.record(time.perf_counter() - start)
+        return result
+
+    def search(self, key):
+        if not self.timing:
+            return self._search(key)
+        start = time.perf_counter()
+        result = self._search(key)
+        self.search_latency.record(time.perf_counter() - start)
+        return result
+
+    def remove(self, key):
+        if not self.timing:
+            return self._remove(key)
+        start = time.perf_counter()
+        result = self._remove(key)
+        self.remove_latency.record(time.perf_counter() - start)
+        return result
+
+    def put(self, key, value):
+        if not self.timing:
+            return self._insert(key, value, True)
+        start = time.perf_counter()
+        result = self._insert(key, value, True)
+        self.insert_latency.record(time.perf_counter() - start)
+        return result
+
+    def get(self, key, default=None):
+        if not self.timing:
+            return self._get(key, default)
+        start = time.perf_counter()
+        result = self._get(key, default)
+        self.search_latency.record(time.perf_counter() - start)
+        return result
+
+    def pop(self, key, default=_MISSING):
+        if not self.timing:
+            found, value = self._pop(key)
+        else:
+            start = time.perf_counter()
+            found, value = self._pop(key)
+            self.remove_latency.record(time.perf_counter() - start)
+
+        if found:
+            return value
+        if default is _MISSING:
+            raise KeyError(key)
+        return default
+
+    def __contains__(self, key):
+        return self.search(key)
+
+    def __len__(self):
+        return self.count
+
+    def keys(self):
+        for table in (self.table, self._old_table):
+            if table is None:
+                continue
+            for bucket in table:
+                if bucket:
+                    yield from bucket
+
+    def _reserve(self, extra):
+        if self.max_load_factor is None:
+            return
+        needed = self.count + extra
+        if needed > self.max_load_factor * self.size:
+            new_size = self.size
+            while needed > self.max_load_factor * new_size:
+                new_size = self._grow_size(new_size)
+            self._resize(new_size)
+        self._finish_rehash()
+
+    def put_many(self, items):
+        if isinstance(items, dict):
+            items = items.items()
+        items = list(items)
+        self._reserve(len(items))
+
+        if self._trace is not None:
+            return sum(self._insert(key, value, True) for key, value in items)
+
+        table = self.table
+        values = self.values
+        size = self.size
+        hash_function = self.hash_function
+        mask = size - 1 if self.power_of_two else 0
+        bucket_put = self._bucket_put
+        inserted = 0
+        for key, value in items:
+            h = hash_function(key)
+            index = h & mask if mask else h % size
+            if table[index] is None:
+                table[index] = [key]
+                values[index] = [value]
+                inserted += 1
+            elif bucket_put(table, values, index, key, value, True):
+                inserted += 1
+
+        self.count += inserted
+        return inserted
+
+    def get_many(self, keys, default=None):
+        self._finish_rehash()
+        table = self.table
+        values = self.values
+        size = self.size
+        hash_function = self.hash_function
+        mask = size - 1 if self.power_of_two else 0
+        result = []
+        append = result.append
+        for key in keys:
+            h = hash_function(key)
+            index = h & mask if mask else h % size
+            bucket = table[index]
+            if not bucket:
+                append(default)
+            elif type(bucket) is TreeBucket:
+                append(bucket.get(key, default))
+            else:
+                try:
+                    append(values[index][bucket.index(key)])
+                except ValueError:
+                    append(default)
+        return result
+
+    def delete_many(self, keys):
+        self._finish_rehash()
+        if self._trace is not None:
+            return sum(self._pop(key)[0] for key in keys)
+
+        table = self.table
+        values = self.values
+        size = self.size
+        hash_function = self.hash_function
+        mask = size - 1 if self.power_of_two else 0
+        bucket_pop = self._bucket_pop
+        removed = 0
+        for key in keys:
+            h = hash_function(key)
+            index = h & mask if mask else h % size
+            if table[index] and bucket_pop(table, values, index, key)[0]:
+                removed += 1
+
+        self.count -= removed
+        self._check_shrink()
+        return removed
+
+    def report(self):
         return {
             "tamanho_tabela": self.size,
+            "redimensionamentos": self.resize_count,
+            "conversoes_arvore": self.treeify_count,
             "colisoes_totais": self.collision_count,
-            "tempo_medio_insercao": avg(self.insert_times),
-            "tempo_medio_busca": avg(self.search_times),
-            "tempo_medio_remocao": avg(self.remove_times),
+            "tempo_medio_insercao": self.insert_latency.mean(),
+            "tempo_medio_busca": self.search_latency.mean(),
+            "tempo_medio_remocao": self.remove_latency.mean(),
+            "latencia_insercao": self.insert_latency.summary(),
+            "latencia_busca": self.search_latency.summary(),
+            "latencia_remocao": self.remove_latency.summary(),
         }
 
     def print_table(self):
+        self._finish_rehash()
         print("Tabela Hash (encadeamento externo):")
         for i, bucket in enumerate(self.table):
             if not bucket:
@@ -122,10 +688,19 @@ class HashTableChaining:
 def print_report(report):
     print("\nResumo das métricas da tabela (encadeamento externo):")
     print(f"Tamanho da tabela:     {report['tamanho_tabela']}")
+    print(f"Redimensionamentos:    {report['redimensionamentos']}")
+    print(f"Listas viradas árvore: {report['conversoes_arvore']}")
     print(f"Colisões totais:       {report['colisoes_totais']}")
     print(f"Tempo médio inserção:  {report['tempo_medio_insercao']:.8f} s")
     print(f"Tempo médio busca:     {report['tempo_medio_busca']:.8f} s")
     print(f"Tempo médio remoção:   {report['tempo_medio_remocao']:.8f} s")
+    print("Distribuição das latências:")
+    for nome, chave in (
+        ("inserção", "latencia_insercao"),
+        ("busca", "latencia_busca"),
+        ("remoção", "latencia_remocao"),
+    ):
+        print("  " + format_summary(nome, report[chave]))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,186 @@
+import threading
+
+from hash_chaining import HashTableChaining, _bucket_items
+
+
+class StripedHashTableChaining(HashTableChaining):
+    def __init__(self, size=11, stripes=16, max_load_factor=1.0, timing=False, **kwargs):
+        self.stripes = stripes
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        super().__init__(
+            size=size,
+            timing=timing,
+            max_load_factor=max_load_factor,
+            min_load_factor=None,
+            incremental=False,
+            **kwargs,
+        )
+
+    @property
+    def count(self):
+        return sum(self._stripe_counts)
+
+    @count.setter
+    def count(self, value):
+        self._stripe_counts = [value] + [0] * (self.stripes - 1)
+
+    def _stripe(self, index, size):
+        return index * self.stripes // size
+
+    def _lock_bucket(self, key):
+        while True:
+            table = self.table
+            size = len(table)
+            index = self._index_for(key, size)
+            stripe = self._stripe(index, size)
+            lock = self._locks[stripe]
+            lock.acquire()
+            if self.table is table:
+                return table, self.values, index, stripe, lock
+            lock.release()
+
+    def _lock_all(self):
+        for lock in self._locks:
+            lock.acquire()
+
+    def _unlock_all(self):
+        for lock in reversed(self._locks):
+            lock.release()
+
+    def _grow(self, seen_table):
+        self._lock_all()
+        try:
+            if (
+                self.table is not seen_table
+                or self.count <= self.max_load_factor * self.size
+            ):
+                return
+
+            old_table = self.table
+            old_values = self.values
+            new_size = self._grow_size(self.size)
+            table = [None] * new_size
+            values = [None] * new_size
+            stripe_counts = [0] * self.stripes
+            collisions = self.collision_count
+
+            for bucket, bucket_values in zip(old_table, old_values):
+                if not bucket:
+                    continue
+                for key, value in _bucket_items(bucket, bucket_values):
+                    index = self._index_for(key, new_size)
+                    self._bucket_put(table, values, index, key, value, False)
+                    stripe_counts[self._stripe(index, new_size)] += 1
+
+            self.collision_count = collisions
+            self.table = table
+            self.values = values
+            self.size = new_size
+            self._stripe_counts = stripe_counts
+            self.resize_count += 1
+        finally:
+            self._unlock_all()
+
+    def _insert(self, key, value=None, overwrite=False):
+        table, values, index, stripe, lock = self._lock_bucket(key)
+        grow = False
+        try:
+            inserted = self._bucket_put(table, values, index, key, value, overwrite)
+            if inserted:
+                self._stripe_counts[stripe] += 1
+                if self.max_load_factor is not None:
+                    limit = self.max_load_factor * len(table)
+                    grow = (
+                        self._stripe_counts[stripe] * self.stripes > limit
+                        and self.count > limit
+                    )
+        finally:
+            lock.release()
+
+        if grow:
+            self._grow(table)
+        return inserted
+
+    def _search(self, key):
+        table, values, index, stripe, lock = self._lock_bucket(key)
+        try:
+            bucket = table[index]
+            return bucket is not None and key in bucket
+        finally:
+            lock.release()
+
+    def _get(self, key, default=None):
+        table, values, index, stripe, lock = self._lock_bucket(key)
+        try:
+            found, value = self._bucket_find(table, values, index, key)
+        finally:
+            lock.release()
+        return value if found else default
+
+    def _pop(self, key):
+        table, values, index, stripe, lock = self._lock_bucket(key)
+        try:
+            found, value = self._bucket_pop(table, values, index, key)
+            if found:
+                self._stripe_counts[stripe] -= 1
+        finally:
+            lock.release()
+        return found, value
+
+    def put_many(self, items):
+        if isinstance(items, dict):
+            items = items.items()
+        return sum(self._insert(key, value, True) for key, value in items)
+
+    def get_many(self, keys, default=None):
+        return [self._get(key, default) for key in keys]
+
+    def delete_many(self, keys):
+        return sum(self._pop(key)[0] for key in keys)
+
+    def print_table(self):
+        self._lock_all()
+        try:
+            super().print_table()
+        finally:
+            self._unlock_all()
+
+
+class LockedHashTableChaining:
+    def __init__(self, **kwargs):
+        kwargs.setdefault("timing", False)
+        self.table = HashTableChaining(**kwargs)
+        self._lock = threading.Lock()
+
+    def insert(self, key):
+        with self._lock:
+            return self.table.insert(key)
+
+    def search(self, key):
+        with self._lock:
+            return self.table.search(key)
+
+    def remove(self, key):
+        with self._lock:
+            return self.table.remove(key)
+
+
+if __name__ == "__main__":
+    tabela = StripedHashTableChaining(size=7, stripes=4)
+
+    def trabalhador(inicio):
+        for chave in range(inicio, inicio + 1_000):
+            tabela.insert(chave)
+        for chave in range(inicio, inicio + 1_000, 2):
+            tabela.remove(chave)
+
+    threads = [threading.Thread(target=trabalhador, args=(i * 1_000,)) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    print("Chaves na tabela (esperado 4000):", tabela.count)
+    print("Tamanho da tabela:", tabela.size)
+    print("Redimensionamentos:", tabela.resize_count)
+    print("Busca 1001:", tabela.search(1001), "| Busca 1000:", tabela.search(1000))
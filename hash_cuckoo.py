@@ -0,0 +1,376 @@
+import time
+import random
+
+from latency import LatencyHistogram, format_summary
+from tracing import make_trace
+
+TRACE_MESSAGES = {
+    "insert_start": "\n[INSERIR] Quero inserir a chave {key}\nPosições candidatas: {positions}",
+    "insert_duplicate": "A chave já está na tabela",
+    "insert_empty": "Posição {index} vazia, chave guardada",
+    "kick": "Todas as candidatas ocupadas: {key} expulsa {evicted} da posição {index}",
+    "stash": "Ciclo de expulsões: {key} vai para o estoque extra ({used}/{capacity})",
+    "cycle": "Ciclo de expulsões com o estoque extra cheio",
+    "grow": "Fator de carga passaria de {limit}: a tabela precisa crescer",
+    "rehash": "Rehash com novas funções de hash ({old_size} -> {new_size} posições)",
+    "search_start": "\n[BUSCAR] Procurando a chave {key} nas posições {positions}",
+    "search_found": "Chave encontrada na posição {index}",
+    "search_stash": "Chave encontrada no estoque extra",
+    "search_missing": "Chave não está em nenhuma candidata nem no estoque",
+    "remove_start": "\n[REMOVER] Tentando remover a chave {key}",
+    "remove_found": "Chave removida da posição {index}",
+    "remove_stash": "Chave removida do estoque extra",
+    "remove_missing": "Chave não existe",
+}
+
+_PRIME = (1 << 61) - 1
+_MISSING = object()
+
+
+class CuckooHashTable:
+    def __init__(
+        self,
+        size=11,
+        hashes=2,
+        stash_size=4,
+        max_load_factor=0.45,
+        max_kicks=200,
+        seed=None,
+        debug=False,
+        trace_sink=None,
+        timing=True,
+    ):
+        assert hashes >= 2
+        self.size = size
+        self.table = [None] * size
+        self.values = [None] * size
+        self.count = 0
+
+        self.hashes = hashes
+        self.stash_size = stash_size
+        self.stash = []
+        self.max_load_factor = max_load_factor
+        self.max_kicks = max_kicks
+        self._random = random.Random(seed)
+        self._new_functions()
+
+        self.collision_count = 0
+        self.kick_count = 0
+        self.rehash_count = 0
+        self.timing = timing
+        self.insert_latency = LatencyHistogram()
+        self.search_latency = LatencyHistogram()
+        self.remove_latency = LatencyHistogram()
+
+        self.debug = debug
+        self._trace = make_trace(TRACE_MESSAGES, debug, trace_sink)
+
+    def _new_functions(self):
+        rng = self._random
+        self.functions = [
+            (rng.randrange(1, _PRIME), rng.randrange(_PRIME))
+            for _ in range(self.hashes)
+        ]
+
+    def load_factor(self):
+        return self.count / self.size
+
+    def positions(self, key):
+        h = hash(key)
+        size = self.size
+        return [(a * h + b) % _PRIME % size for a, b in self.functions]
+
+    def _find(self, key):
+        table = self.table
+        for index in self.positions(key):
+            if table[index] == key:
+                return index
+        return -1
+
+    def _stash_find(self, key):
+        for i, (stashed, _) in enumerate(self.stash):
+            if stashed == key:
+                return i
+        return -1
+
+    def _place(self, key, value, trace=None):
+        table = self.table
+        values = self.values
+        previous = -1
+        for _ in range(self.max_kicks):
+            candidates = self.positions(key)
+            for index in candidates:
+                if table[index] is None:
+                    if trace is not None:
+                        trace("insert_empty", index=index)
+                    table[index] = key
+                    values[index] = value
+                    return None
+
+            self.collision_count += 1
+            choices = [index for index in candidates if index != previous] or candidates
+            index = self._random.choice(choices)
+            if trace is not None:
+                trace("kick", key=key, evicted=table[index], index=index)
+            table[index], key = key, table[index]
+            values[index], value = value, values[index]
+            self.kick_count += 1
+            previous = index
+        return key, value
+
+    def _rehash(self, pending, grow):
+        old_size = self.size
+        new_size = 2 * old_size + 1 if grow else old_size
+        if self._trace is not None:
+            self._trace("rehash", old_size=old_size, new_size=new_size)
+
+        items = [
+            (key, value)
+            for key, value in zip(self.table, self.values)
+            if key is not None
+        ]
+        items.extend(self.stash)
+        items.extend(pending)
+
+        attempts = 0
+        while True:
+            self.size = new_size
+            self.table = [None] * new_size
+            self.values = [None] * new_size
+            self.stash = []
+            self._new_functions()
+            self.rehash_count += 1
+
+            for key, value in items:
+                leftover = self._place(key, value)
+                if leftover is not None:
+                    if len(self.stash) >= self.stash_size:
+                        break
+                    self.stash.append(leftover)
+            else:
+                return
+            attempts += 1
+            if attempts % 3 == 0:
+                new_size = 2 * new_size + 1
+
+    def _insert(self, key, value=None, overwrite=False):
+        trace = self._trace
+        if trace is not None:
+            trace("insert_start", key=key, positions=self.positions(key))
+
+        index = self._find(key)
+        if index >= 0:
+            if overwrite:
+                self.values[index] = value
+            if trace is not None:
+                trace("insert_duplicate")
+            return False
+        position = self._stash_find(key)
+        if position >= 0:
+            if overwrite:
+                self.stash[position] = (key, value)
+            if trace is not None:
+                trace("insert_duplicate")
+            return False
+
+        self.count += 1
+        if self.count > self.max_load_factor * self.size:
+            if trace is not None:
+                trace("grow", limit=self.max_load_factor)
+            self._rehash([(key, value)], grow=True)
+            return True
+
+        leftover = self._place(key, value, trace)
+        if leftover is None:
+            return True
+
+        if len(self.stash) < self.stash_size:
+            self.stash.append(leftover)
+            if trace is not None:
+                trace("stash", key=leftover[0], used=len(self.stash), capacity=self.stash_size)
+            return True
+
+        if trace is not None:
+            trace("cycle")
+        self._rehash([leftover], grow=False)
+        return True
+
+    def _search(self, key):
+        trace = self._trace
+        if trace is not None:
+            trace("search_start", key=key, positions=self.positions(key))
+
+        index = self._find(key)
+        if index >= 0:
+            if trace is not None:
+                trace("search_found", index=index)
+            return True
+        if self.stash and self._stash_find(key) >= 0:
+            if trace is not None:
+                trace("search_stash")
+            return True
+
+        if trace is not None:
+            trace("search_missing")
+        return False
+
+    def _get(self, key, default=None):
+        index = self._find(key)
+        if index >= 0:
+            return self.values[index]
+        position = self._stash_find(key)
+        if position >= 0:
+            return self.stash[position][1]
+        return default
+
+    def _pop(self, key):
+        trace = self._trace
+        if trace is not None:
+            trace("remove_start", key=key)
+
+        index = self._find(key)
+        if index >= 0:
+            value = self.values[index]
+            self.table[index] = None
+            self.values[index] = None
+            self.count -= 1
+            if trace is not None:
+                trace("remove_found", index=index)
+            return True, value
+
+        position = self._stash_find(key)
+        if position >= 0:
+            value = self.stash.pop(position)[1]
+            self.count -= 1
+            if trace is not None:
+                trace("remove_stash")
+            return True, value
+
+        if trace is not None:
+            trace("remove_missing")
+        return False, None
+
+    def _remove(self, key):
+        return self._pop(key)[0]
+
+    def insert(self, key):
+        if not self.timing:
+            return self._insert(key)
+        start = time.perf_counter()
+        result = self._insert(key)
+        self.insert_latency.record(time.perf_counter() - start)
+        return result
+
+    def search(self, key):
+        if not self.timing:
+            return self._search(key)
+        start = time.perf_counter()
+        result = self._search(key)
+        self.search_latency.record(time.perf_counter() - start)
+        return result
+
+    def remove(self, key):
+        if not self.timing:
+            return self._remove(key)
+        start = time.perf_counter()
+        result = self._remove(key)
+        self.remove_latency.record(time.perf_counter() - start)
+        return result
+
+    def put(self, key, value):
+        if not self.timing:
+            return self._insert(key, value, True)
+        start = time.perf_counter()
+        result = self._insert(key, value, True)
+        self.insert_latency.record(time.perf_counter() - start)
+        return result
+
+    def get(self, key, default=None):
+        if not self.timing:
+            return self._get(key, default)
+        start = time.perf_counter()
+        result = self._get(key, default)
+        self.search_latency.record(time.perf_counter() - start)
+        return result
+
+    def pop(self, key, default=_MISSING):
+        if not self.timing:
+            found, value = self._pop(key)
+        else:
+            start = time.perf_counter()
+            found, value = self._pop(key)
+            self.remove_latency.record(time.perf_counter() - start)
+
+        if found:
+            return value
+        if default is _MISSING:
+            raise KeyError(key)
+        return default
+
+    def __contains__(self, key):
+        return self.search(key)
+
+    def __len__(self):
+        return self.count
+
+    def report(self):
+        return {
+            "tamanho_tabela": self.size,
+            "fator_de_carga": round(self.load_factor(), 3),
+            "colisoes_totais": self.collision_count,
+            "deslocamentos": self.kick_count,
+            "rehashes": self.rehash_count,
+            "itens_no_estoque": len(self.stash),
+            "tempo_medio_insercao": self.insert_latency.mean(),
+            "tempo_medio_busca": self.search_latency.mean(),
+            "tempo_medio_remocao": self.remove_latency.mean(),
+            "latencia_insercao": self.insert_latency.summary(),
+            "latencia_busca": self.search_latency.summary(),
+            "latencia_remocao": self.remove_latency.summary(),
+        }
+
+    def print_table(self):
+        print(f"\nTabela Hash (cuckoo, {self.hashes} funções de hash):")
+        for i, item in enumerate(self.table):
+            if item is None:
+                print(f"{i}: vazio")
+            else:
+                print(f"{i}: {item}")
+        print(f"Estoque extra: {[key for key, _ in self.stash]}")
+
+
+def print_report(report):
+    print("\nMétricas da tabela Hash (cuckoo):")
+    print(f"Tamanho da tabela:     {report['tamanho_tabela']}")
+    print(f"Fator de carga:        {report['fator_de_carga']}")
+    print(f"Colisões totais:       {report['colisoes_totais']}")
+    print(f"Deslocamentos:         {report['deslocamentos']}")
+    print(f"Rehashes:              {report['rehashes']}")
+    print(f"Itens no estoque:      {report['itens_no_estoque']}")
+    print(f"Tempo médio inserção:  {report['tempo_medio_insercao']:.8f} s")
+    print(f"Tempo médio busca:     {report['tempo_medio_busca']:.8f} s")
+    print(f"Tempo médio remoção:   {report['tempo_medio_remocao']:.8f} s")
+    print("Distribuição das latências:")
+    for nome, chave in (
+        ("inserção", "latencia_insercao"),
+        ("busca", "latencia_busca"),
+        ("remoção", "latencia_remocao"),
+    ):
+        print("  " + format_summary(nome, report[chave]))
+
+
+if __name__ == "__main__":
+    h = CuckooHashTable(size=11, stash_size=1, max_load_factor=0.8, seed=3, debug=True)
+
+    for chave in (10, 17, 21, 32, 43, 54, 65, 76):
+        h.insert(chave)
+
+    print("\nTabela após inserções:")
+    h.print_table()
+
+    h.search(21)
+    h.search(99)
+    h.remove(32)
+
+    h.print_table()
+    print_report(h.report())
@@ -0,0 +1,155 @@
+import numpy as np
+
+EMPTY = np.iinfo(np.int64).min
+DELETED = EMPTY + 1
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+
+
+class NumpyIntHashTable:
+    def __init__(self, size=16, max_load_factor=0.7):
+        if not 0 < max_load_factor < 1:
+            raise ValueError("O fator de carga máximo precisa estar entre 0 e 1 para sempre restar uma posição vazia")
+        self.max_load_factor = max_load_factor
+        self._allocate(max(2, 1 << max(0, size - 1).bit_length()))
+        self.count = 0
+        self.tombstones = 0
+        self.resize_count = 0
+        self.compaction_count = 0
+
+    def _allocate(self, size):
+        self.size = size
+        self.bits = size.bit_length() - 1
+        self.mask = size - 1
+        self.slots = np.full(size, EMPTY, dtype=np.int64)
+
+    def load_factor(self):
+        return self.count / self.size
+
+    def _home(self, keys):
+        with np.errstate(over="ignore"):
+            mixed = keys.view(np.uint64) * _GOLDEN
+        return (mixed >> np.uint64(64 - self.bits)).astype(np.int64)
+
+    def _as_keys(self, keys):
+        keys = np.asarray(keys, dtype=np.int64).ravel()
+        if keys.size and (keys <= DELETED).any():
+            raise ValueError("Chaves reservadas para posições vazias/removidas não podem ser usadas")
+        return keys
+
+    def _locate(self, keys):
+        positions = np.full(keys.size, -1, dtype=np.int64)
+        active = np.arange(keys.size)
+        index = self._home(keys)
+        slots = self.slots
+        mask = self.mask
+        while active.size:
+            current = slots[index]
+            hit = current == keys[active]
+            positions[active[hit]] = index[hit]
+            keep = ~(hit | (current == EMPTY))
+            active = active[keep]
+            index = (index[keep] + 1) & mask
+        return positions
+
+    def _rebuild(self, size):
+        live = self.slots[self.slots > DELETED]
+        if size == self.size:
+            self.slots.fill(EMPTY)
+            self.compaction_count += 1
+        else:
+            self._allocate(size)
+            self.resize_count += 1
+        self.tombstones = 0
+        self._place(live)
+
+    def _reserve(self, extra):
+        if self.count + self.tombstones + extra <= self.max_load_factor * self.size:
+            return
+        size = self.size
+        while self.count + extra > self.max_load_factor * size:
+            size *= 2
+        self._rebuild(size)
+
+    def _place(self, keys):
+        slots = self.slots
+        mask = self.mask
+        active = keys
+        index = self._home(keys)
+        while active.size:
+            current = slots[index]
+            free = current <= DELETED
+            slots[index[free]] = active[free]
+            placed = free & (slots[index] == active)
+            self.tombstones -= int((current[placed] == DELETED).sum())
+
+            keep = ~placed
+            active = active[keep]
+            index = (index[keep] + 1) & mask
+
+    def insert_many(self, keys):
+        keys = np.unique(self._as_keys(keys))
+        keys = keys[self._locate(keys) < 0]
+        if not keys.size:
+            return 0
+        self._reserve(keys.size)
+        self._place(keys)
+        self.count += keys.size
+        return int(keys.size)
+
+    def search_many(self, keys):
+        return self._locate(self._as_keys(keys)) >= 0
+
+    def delete_many(self, keys):
+        positions = self._locate(np.unique(self._as_keys(keys)))
+        positions = positions[positions >= 0]
+        self.slots[positions] = DELETED
+        self.count -= positions.size
+        self.tombstones += positions.size
+        return int(positions.size)
+
+    def insert(self, key):
+        return self.insert_many([key]) == 1
+
+    def search(self, key):
+        return bool(self.search_many([key])[0])
+
+    def remove(self, key):
+        return self.delete_many([key]) == 1
+
+    def __contains__(self, key):
+        return self.search(key)
+
+    def __len__(self):
+        return self.count
+
+    def memory_bytes(self):
+        return self.slots.nbytes
+
+    def report(self):
+        return {
+            "tamanho_tabela": self.size,
+            "fator_de_carga": round(self.load_factor(), 3),
+            "lapides": self.tombstones,
+            "redimensionamentos": self.resize_count,
+            "compactacoes": self.compaction_count,
+            "bytes_por_chave": round(self.memory_bytes() / max(1, self.count), 1),
+        }
+
+
+def print_report(report):
+    print("\nMétricas da tabela Hash (NumPy, int64):")
+    print(f"Tamanho da tabela:     {report['tamanho_tabela']}")
+    print(f"Fator de carga:        {report['fator_de_carga']}")
+    print(f"Lápides:               {report['lapides']}")
+    print(f"Redimensionamentos:    {report['redimensionamentos']}")
+    print(f"Compactações:          {report['compactacoes']}")
+    print(f"Bytes por chave:       {report['bytes_por_chave']}")
+
+
+if __name__ == "__main__":
+    tabela = NumpyIntHashTable(size=8)
+    print("Inseridas:", tabela.insert_many([10, 17, 21, 32, 43, 54, 17, 10]))
+    print("Busca em lote [21, 99, 54]:", tabela.search_many([21, 99, 54]).tolist())
+    print("Removidas:", tabela.delete_many([32, 99]))
+    print("Busca 32 após remoção:", tabela.search(32))
+    print_report(tabela.report())
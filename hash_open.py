@@ -1,146 +1,703 @@
 import time
 
+from latency import LatencyHistogram, format_summary
+from tracing import make_trace
+from probing import PROBE_STRATEGIES
+from hashing import make_hash_function, next_power_of_two
+
+TRACE_MESSAGES = {
+    "insert_start": "\n[INSERIR] Quero inserir a chave {key}\nHash primário: {hash1}",
+    "hash2": "Hash secundário: {hash2}",
+    "probe": "Tentativa {i}: posição {index}",
+    "insert_empty": "Posição vazia encontrada",
+    "insert_deleted": "Posição marcada como REMOVIDA, continuo procurando a chave mais adiante",
+    "insert_reuse": "A chave não está na tabela: reaproveitando a posição removida {index}",
+    "insert_duplicate": "A chave já está na tabela na posição {index}: não é inserida de novo",
+    "insert_collision": "Colisão! Já existe {slot} nessa posição",
+    "insert_failed": "Falha ao inserir: tabela cheia após sondagens",
+    "search_start": "\n[BUSCAR] Procurando a chave {key}",
+    "search_empty": "Posição vazia, chave não está na tabela",
+    "search_found": "Chave encontrada",
+    "search_other": "Elemento diferente encontrado ({slot}), continuando sondagem",
+    "search_exhausted": "Chave não encontrada após todas as sondagens",
+    "remove_start": "\n[REMOVER] Tentando remover a chave {key}",
+    "remove_empty": "Posição vazia, chave não existe",
+    "remove_found": "Chave encontrada, marcando como removida",
+    "remove_other": "Elemento diferente ({slot}), continuando sondagem",
+    "resize": "Ocupação {load:.2f} (chaves + removidas): redimensionando de {old_size} para {new_size} posições",
+    "robinhood_swap": "{slot} está mais perto de casa (deslocamento {slot_dist} < {dist}): toma o lugar e segue levando {slot}",
+    "search_stop": "{slot} tem deslocamento {slot_dist} < {dist}: a chave não pode estar mais adiante",
+    "shift_back": "Recuando {slot} da posição {index} para {target}",
+    "compact": "Ocupação {load:.2f} com {tombstones} posições removidas: reorganizando as {size} posições sem crescer",
+}
+
 class DeletedEntry:
     pass
 
 DELETED = DeletedEntry()
+_MISSING = object()
+
 
 class OpenAddressHashTable:
-    def __init__(self, size=11, method="linear", debug=False):
+    def __init__(
+        self,
+        size=11,
+        method="linear",
+        debug=False,
+        trace_sink=None,
+        timing=True,
+        max_load_factor=0.7,
+        hash_function="python",
+        seed=None,
+        power_of_two=False,
+    ):
+        self.power_of_two = power_of_two
+        if power_of_two:
+            size = next_power_of_two(size)
+        self.hash_function = make_hash_function(hash_function, seed)
+
         self.size = size
         self.table = [None] * size
+        self.values = [None] * size
         self.count = 0
+        self.tombstones = 0
+
+        self.max_load_factor = max_load_factor
+        self.resize_count = 0
+        self.compaction_count = 0
 
-        assert method in ["linear", "quadratic", "double"]
+        assert method in PROBE_STRATEGIES
         self.method = method
+        self.strategy = PROBE_STRATEGIES[method]
+        if power_of_two:
+            self.strategy = self.strategy.masked()
+        self.strategy.check_size(size)
+        if self.strategy.robin_hood:
+            self._place = self._robinhood_place_new
+            self._insert_new = self._robinhood_insert
+            self._find_slot = self._robinhood_find
+            self._traced_find = self._robinhood_find
+            self._pop_slot = self._robinhood_pop
+        else:
+            self._place = self._probe_place
+            self._insert_new = self._probe_insert
+            self._find_slot = self._probe_find
+            self._traced_find = self._probe_find_traced
+            self._pop_slot = self._probe_pop
 
         self.collision_count = 0
-        self.insert_times = []
-        self.search_times = []
-        self.remove_times = []
+        self.timing = timing
+        self.insert_latency = LatencyHistogram()
+        self.search_latency = LatencyHistogram()
+        self.remove_latency = LatencyHistogram()
 
         self.debug = debug
-
-    def _log(self, msg: str):
-        if self.debug:
-            print(msg)
+        self._trace = make_trace(TRACE_MESSAGES, debug, trace_sink)
 
     def load_factor(self):
         return self.count / self.size
 
     def hash1(self, key):
-        return hash(key) % self.size
+        return self.strategy.home(self.hash_function(key), self.size)
 
     def hash2(self, key):
-        return 1 + (hash(key) % (self.size - 1))
+        return 1 + (self.hash_function(key) % (self.size - 1))
+
+    def _next_size(self, size):
+        return self.strategy.next_size(size)
+
+    def _robinhood_place(self, key, value, trace=None, index=None, dist=0):
+        table = self.table
+        values = self.values
+        size = self.size
+        hash_function = self.hash_function
+        home = self.strategy.home
+        if index is None:
+            index = home(hash_function(key), size)
+        for steps in range(dist, size):
+            slot = table[index]
+            if trace is not None:
+                trace("probe", i=dist, index=index)
+
+            if slot is None:
+                if trace is not None:
+                    trace("insert_empty")
+                table[index] = key
+                values[index] = value
+                return steps
+
+            slot_dist = (index - home(hash_function(slot), size)) % size
+            if slot_dist < dist:
+                if trace is not None:
+                    trace("robinhood_swap", slot=slot, slot_dist=slot_dist, dist=dist)
+                table[index], key = key, slot
+                values[index], value = value, values[index]
+                dist = slot_dist
+            elif trace is not None:
+                trace("insert_collision", slot=slot)
+
+            index = (index + 1) % size
+            dist += 1
+        return -1
+
+    def _robinhood_insert(self, key, value, overwrite, update):
+        trace = self._trace
+        table = self.table
+        size = self.size
+        hash_function = self.hash_function
+        home = self.strategy.home
+        index = home(hash_function(key), size)
+        for dist in range(size):
+            slot = table[index]
+            if slot is None or (index - home(hash_function(slot), size)) % size < dist:
+                if self._check_grow():
+                    steps = self._robinhood_place(key, value, trace)
+                else:
+                    steps = self._robinhood_place(key, value, trace, index, dist)
+                if steps < 0:
+                    return None
+                self.collision_count += steps
+                self.count += 1
+                return True
 
-    def _probe(self, key, i):
-        if self.method == "linear":
-            return (self.hash1(key) + i) % self.size
-        elif self.method == "quadratic":
-            return (self.hash1(key) + i * i) % self.size
-        elif self.method == "double":
-            return (self.hash1(key) + i * self.hash2(key)) % self.size
+            if trace is not None:
+                trace("probe", i=dist, index=index)
+            if slot == key:
+                if trace is not None:
+                    trace("insert_duplicate", index=index)
+                self._update_value(index, value, overwrite, update)
+                return False
 
-    def insert(self, key):
-        start = time.perf_counter()
+            if trace is not None:
+                trace("insert_collision", slot=slot)
+            index = (index + 1) % size
+        return None
+
+    def _robinhood_find(self, key):
+        trace = self._trace
+        table = self.table
+        size = self.size
+        hash_function = self.hash_function
+        home = self.strategy.home
+        index = home(hash_function(key), size)
+        for dist in range(size):
+            slot = table[index]
+            if trace is not None:
+                trace("probe", i=dist, index=index)
+
+            if slot is None:
+                if trace is not None:
+                    trace("search_empty")
+                return -1
+
+            if slot == key:
+                if trace is not None:
+                    trace("search_found")
+                return index
+
+            slot_dist = (index - home(hash_function(slot), size)) % size
+            if slot_dist < dist:
+                if trace is not None:
+                    trace("search_stop", slot=slot, slot_dist=slot_dist, dist=dist)
+                return -1
+
+            if trace is not None:
+                trace("search_other", slot=slot)
+            index = (index + 1) % size
+
+        if trace is not None:
+            trace("search_exhausted")
+        return -1
+
+    def _robinhood_pop(self, key):
+        index = self._robinhood_find(key)
+        if index < 0:
+            return False, None
+
+        trace = self._trace
+        table = self.table
+        values = self.values
+        size = self.size
+        hash_function = self.hash_function
+        home = self.strategy.home
+        value = values[index]
+        for _ in range(size - 1):
+            following = (index + 1) % size
+            slot = table[following]
+            if slot is None or home(hash_function(slot), size) == following:
+                break
+            if trace is not None:
+                trace("shift_back", slot=slot, index=following, target=index)
+            table[index] = slot
+            values[index] = values[following]
+            index = following
+
+        table[index] = None
+        values[index] = None
+        self.count -= 1
+        return True, value
+
+    def probe_length(self, key):
+        table = self.table
+        size = self.size
+        hash_function = self.hash_function
+        home = self.strategy.home
+        robinhood = self.strategy.robin_hood
+        for i, index in enumerate(self.strategy.probes(hash_function(key), size)):
+            slot = table[index]
+            if slot is None or slot == key:
+                return i + 1
+            if robinhood and (index - home(hash_function(slot), size)) % size < i:
+                return i + 1
+        return size
+
+    def _robinhood_place_new(self, key, value):
+        return self._robinhood_place(key, value) >= 0
+
+    def _probe_place(self, key, value):
+        table = self.table
+        for index in self.strategy.probes(self.hash_function(key), self.size):
+            if table[index] is None:
+                table[index] = key
+                self.values[index] = value
+                return True
+        return False
 
+    def _resize(self, new_size):
+        if self._trace is not None:
+            load = (self.count + self.tombstones) / self.size
+            if new_size == self.size:
+                self._trace("compact", load=load, tombstones=self.tombstones, size=new_size)
+            else:
+                self._trace("resize", load=load, old_size=self.size, new_size=new_size)
+
+        table = self.table
+        values = self.values
+        items = [
+            (key, values[i])
+            for i, key in enumerate(table)
+            if key is not None and key is not DELETED
+        ]
+
+        if new_size == self.size:
+            table[:] = [None] * new_size
+            values[:] = [None] * new_size
+            self.compaction_count += 1
+        else:
+            self.table = [None] * new_size
+            self.values = [None] * new_size
+            self.size = new_size
+            self.resize_count += 1
+        self.tombstones = 0
+
+        for key, value in items:
+            while not self._place(key, value):
+                self._resize(self._next_size(self.size))
+
+    def _check_grow(self):
+        if (
+            self.max_load_factor is None
+            or self.count + self.tombstones + 1 <= self.max_load_factor * self.size
+        ):
+            return False
+        if self.tombstones >= self.count:
+            self._resize(self.size)
+        else:
+            self._resize(self._next_size(self.size))
+        return True
+
+    def _reserve(self, extra):
+        if (
+            self.max_load_factor is None
+            or self.count + self.tombstones + extra <= self.max_load_factor * self.size
+        ):
+            return
+        new_size = self.size
+        while self.count + extra > self.max_load_factor * new_size:
+            new_size = self._next_size(new_size)
+        self._resize(new_size)
+
+    def _update_value(self, index, value, overwrite, update):
+        if update is not None:
+            self.values[index] = update(self.values[index])
+        elif overwrite:
+            self.values[index] = value
+
+    def _insert(self, key, value=None, overwrite=False, update=None):
+        trace = self._trace
+        if trace is None:
+            index = self.strategy.home(self.hash_function(key), self.size)
+            if self.table[index] == key:
+                self._update_value(index, value, overwrite, update)
+                return False
+        else:
+            trace("insert_start", key=key, hash1=self.hash1(key))
+            if self.method == "double":
+                trace("hash2", hash2=self.hash2(key))
+
+        inserted = self._insert_new(key, value, overwrite, update)
+        if inserted is not None:
+            return inserted
+
+        if trace is not None:
+            trace("insert_failed")
+        if self.max_load_factor is not None:
+            self._resize(self._next_size(self.size))
+            return self._insert(key, value, overwrite, update)
         if self.count == self.size:
             raise Exception("Tabela cheia")
+        return False
 
-        self._log(f"\n[INSERIR] Quero inserir a chave {key}")
-        self._log(f"Hash primário: {self.hash1(key)}")
-        if self.method == "double":
-            self._log(f"Hash secundário: {self.hash2(key)}")
+    def _probe_insert(self, key, value, overwrite, update):
+        trace = self._trace
+        table = self.table
+        reusable = -1
+        target = -1
+        for i, index in enumerate(self.strategy.probes(self.hash_function(key), self.size)):
+            slot = table[index]
+            if trace is not None:
+                trace("probe", i=i, index=index)
+
+            if slot is None:
+                target = index
+                break
+
+            if slot is DELETED:
+                if trace is not None:
+                    trace("insert_deleted")
+                if reusable < 0:
+                    reusable = index
+                continue
+
+            if slot == key:
+                if trace is not None:
+                    trace("insert_duplicate", index=index)
+                self._update_value(index, value, overwrite, update)
+                return False
 
-        for i in range(self.size):
-            index = self._probe(key, i)
-            self._log(f"Tentativa {i}: posição {index}")
+            self.collision_count += 1
+            if trace is not None:
+                trace("insert_collision", slot=slot)
+
+        if reusable >= 0:
+            target = reusable
+            if trace is not None:
+                trace("insert_reuse", index=reusable)
+        elif target < 0:
+            return None
+        elif trace is not None:
+            trace("insert_empty")
+
+        if self._check_grow():
+            if not self._place(key, value):
+                return None
+        else:
+            table[target] = key
+            self.values[target] = value
+            if target == reusable:
+                self.tombstones -= 1
+        self.count += 1
+        return True
+
+    def _search(self, key):
+        trace = self._trace
+        if trace is None:
+            return self._find_slot(key) >= 0
+        trace("search_start", key=key)
+        return self._traced_find(key) >= 0
+
+    def _probe_find_traced(self, key):
+        trace = self._trace
+        table = self.table
+        for i, index in enumerate(self.strategy.probes(self.hash_function(key), self.size)):
+            slot = table[index]
+            trace("probe", i=i, index=index)
+
+            if slot is None:
+                trace("search_empty")
+                return -1
+
+            if slot == key:
+                trace("search_found")
+                return index
+
+            trace("search_other", slot=slot)
+
+        trace("search_exhausted")
+        return -1
+
+    def _probe_find(self, key):
+        table = self.table
+        h = self.hash_function(key)
+        index = self.strategy.home(h, self.size)
+        slot = table[index]
+        if slot is None:
+            return -1
+        if slot == key:
+            return index
+
+        for index in self.strategy.probes(h, self.size):
+            slot = table[index]
+            if slot is None:
+                return -1
+            if slot == key:
+                return index
+        return -1
+
+    def _get(self, key, default=None):
+        index = self._find_slot(key)
+        if index >= 0:
+            return self.values[index]
+        return default
+
+    def _pop(self, key):
+        trace = self._trace
+        if trace is not None:
+            trace("remove_start", key=key)
+
+        return self._pop_slot(key)
+
+    def _probe_pop(self, key):
+        trace = self._trace
+        table = self.table
+        for i, index in enumerate(self.strategy.probes(self.hash_function(key), self.size)):
+            slot = table[index]
+            if trace is not None:
+                trace("probe", i=i, index=index)
+
+            if slot is None:
+                if trace is not None:
+                    trace("remove_empty")
+                return False, None
+
+            if slot == key:
+                if trace is not None:
+                    trace("remove_found")
+                value = self.values[index]
+                table[index] = DELETED
+                self.values[index] = None
+                self.count -= 1
+                self.tombstones += 1
+                return True, value
 
-            if self.table[index] is None:
-                self._log("Posição vazia encontrada")
-                self.table[index] = key
-                self.count += 1
-                self.insert_times.append(time.perf_counter() - start)
-                return True
+            if trace is not None:
+                trace("remove_other", slot=slot)
 
-            if self.table[index] is DELETED:
-                self._log("Posição marcada como REMOVIDA")
-                self.table[index] = key
-                self.count += 1
-                self.insert_times.append(time.perf_counter() - start)
-                return True
+        if trace is not None:
+            trace("search_exhausted")
+        return False, None
 
-            self.collision_count += 1
-            self._log(f"Colisão! Já existe {self.table[index]} nessa posição")
+    def _remove(self, key):
+        return self._pop(key)[0]
 
-        self._log("Falha ao inserir: tabela cheia após sondagens")
-        self.insert_times.append(time.perf_counter() - start)
-        return False
+    def insert(self, key):
+        if not self.timing:
+            return self._insert(key)
+        start = time.perf_counter()
+        result = self._insert(key)
+        self.insert_latency.record(time.perf_counter() - start)
+        return result
 
     def search(self, key):
+        if not self.timing:
+            return self._search(key)
         start = time.perf_counter()
-
-        self._log(f"\n[BUSCAR] Procurando a chave {key}")
-
-        for i in range(self.size):
-            index = self._probe(key, i)
-            self._log(f"Tentativa {i}: posição {index}")
-
-            if self.table[index] is None:
-                self._log("Posição vazia, chave não está na tabela")
-                self.search_times.append(time.perf_counter() - start)
-                return False
-
-            if self.table[index] == key:
-                self._log("Chave encontrada")
-                self.search_times.append(time.perf_counter() - start)
-                return True
-
-            self._log(f"Elemento diferente encontrado ({self.table[index]}), continuando sondagem")
-
-        self._log("Chave não encontrada após todas as sondagens")
-        self.search_times.append(time.perf_counter() - start)
-        return False
+        result = self._search(key)
+        self.search_latency.record(time.perf_counter() - start)
+        return result
 
     def remove(self, key):
+        if not self.timing:
+            return self._remove(key)
         start = time.perf_counter()
+        result = self._remove(key)
+        self.remove_latency.record(time.perf_counter() - start)
+        return result
 
-        self._log(f"\n[REMOVER] Tentando remover a chave {key}")
-
-        for i in range(self.size):
-            index = self._probe(key, i)
-            self._log(f"Tentativa {i}: posição {index}")
-
-            if self.table[index] is None:
-                self._log("Posição vazia, chave não existe")
-                self.remove_times.append(time.perf_counter() - start)
-                return False
-
-            if self.table[index] == key:
-                self._log("Chave encontrada, marcando como removida")
-                self.table[index] = DELETED
-                self.count -= 1
-                self.remove_times.append(time.perf_counter() - start)
-                return True
+    def put(self, key, value):
+        if not self.timing:
+            return self._insert(key, value, True)
+        start = time.perf_counter()
+        result = self._insert(key, value, True)
+        self.insert_latency.record(time.perf_counter() - start)
+        return result
 
-            self._log(f"Elemento diferente ({self.table[index]}), continuando sondagem")
+    def upsert(self, key, value, update=None):
+        if not self.timing:
+            return self._insert(key, value, True, update)
+        start = time.perf_counter()
+        result = self._insert(key, value, True, update)
+        self.insert_latency.record(time.perf_counter() - start)
+        return result
 
-        self._log("Chave não encontrada após todas as sondagens")
-        self.remove_times.append(time.perf_counter() - start)
-        return False
+    def get(self, key, default=None):
+        if not self.timing:
+            return self._get(key, default)
+        start = time.perf_counter()
+        result = self._get(key, default)
+        self.search_latency.record(time.perf_counter() - start)
+        return result
+
+    def pop(self, key, default=_MISSING):
+        if not self.timing:
+            found, value = self._pop(key)
+        else:
+            start = time.perf_counter()
+            found, value = self._pop(key)
+            self.remove_latency.record(time.perf_counter() - start)
+
+        if found:
+            return value
+        if default is _MISSING:
+            raise KeyError(key)
+        return default
+
+    def __contains__(self, key):
+        return self.search(key)
+
+    def __len__(self):
+        return self.count
+
+    def keys(self):
+        for key in self.table:
+            if key is not None and key is not DELETED:
+                yield key
+
+    def put_many(self, items):
+        if isinstance(items, dict):
+            items = items.items()
+        items = list(items)
+        self._reserve(len(items))
+        if self._trace is not None or self.strategy.robin_hood:
+            return sum(self._insert(key, value, True) for key, value in items)
+
+        table = self.table
+        values = self.values
+        probes = self.strategy.probes
+        home = self.strategy.home
+        hash_function = self.hash_function
+        size = self.size
+        start_count = self.count
+        inserted = 0
+        collisions = 0
+        for key, value in items:
+            h = hash_function(key)
+            index = home(h, size)
+            slot = table[index]
+            if slot is None:
+                table[index] = key
+                values[index] = value
+                inserted += 1
+                continue
+            if slot == key:
+                values[index] = value
+                continue
+
+            reusable = -1
+            target = -1
+            for index in probes(h, size):
+                slot = table[index]
+                if slot is None:
+                    target = index if reusable < 0 else reusable
+                    break
+                if slot is DELETED:
+                    if reusable < 0:
+                        reusable = index
+                elif slot == key:
+                    values[index] = value
+                    break
+                else:
+                    collisions += 1
+            else:
+                target = reusable
+                if target < 0:
+                    self.count += inserted
+                    inserted = 0
+                    self._insert(key, value, True)
+                    table = self.table
+                    values = self.values
+                    size = self.size
+                    continue
+
+            if target >= 0:
+                if target == reusable:
+                    self.tombstones -= 1
+                table[target] = key
+                values[target] = value
+                inserted += 1
+
+        self.count += inserted
+        self.collision_count += collisions
+        return self.count - start_count
+
+    def get_many(self, keys, default=None):
+        table = self.table
+        values = self.values
+        probes = self.strategy.probes
+        home = self.strategy.home
+        hash_function = self.hash_function
+        size = self.size
+        result = []
+        append = result.append
+        for key in keys:
+            h = hash_function(key)
+            slot = table[home(h, size)]
+            if slot is None:
+                append(default)
+                continue
+            if slot == key:
+                append(values[home(h, size)])
+                continue
+            for index in probes(h, size):
+                slot = table[index]
+                if slot is None:
+                    append(default)
+                    break
+                if slot == key:
+                    append(values[index])
+                    break
+            else:
+                append(default)
+        return result
+
+    def delete_many(self, keys):
+        if self._trace is not None or self.strategy.robin_hood:
+            return sum(self._remove(key) for key in keys)
+
+        table = self.table
+        values = self.values
+        probes = self.strategy.probes
+        hash_function = self.hash_function
+        size = self.size
+        removed = 0
+        for key in keys:
+            for index in probes(hash_function(key), size):
+                slot = table[index]
+                if slot is None:
+                    break
+                if slot == key:
+                    table[index] = DELETED
+                    values[index] = None
+                    removed += 1
+                    break
+        self.count -= removed
+        self.tombstones += removed
+        return removed
 
     def report(self):
-        def avg(lst):
-            return sum(lst) / len(lst) if lst else 0.0
-
         return {
             f"tamanho_tabela": self.size,
             f"fator_de_carga": round(self.load_factor(), 3),
+            f"lapides": self.tombstones,
+            f"redimensionamentos": self.resize_count,
+            f"compactacoes": self.compaction_count,
             f"colisoes_totais": self.collision_count,
-            f"tempo_medio_insercao": avg(self.insert_times),
-            f"tempo_medio_busca": avg(self.search_times),
-            f"tempo_medio_remocao": avg(self.remove_times),
+            f"tempo_medio_insercao": self.insert_latency.mean(),
+            f"tempo_medio_busca": self.search_latency.mean(),
+            f"tempo_medio_remocao": self.remove_latency.mean(),
+            f"latencia_insercao": self.insert_latency.summary(),
+            f"latencia_busca": self.search_latency.summary(),
+            f"latencia_remocao": self.remove_latency.summary(),
         }
 
     def print_table(self):
@@ -157,10 +714,20 @@ def print_report(report):
         print("\nMetricas da tabela Hash (Endereçamento aberto):")
         print(f"Tamanho da tabela:     {report['tamanho_tabela']}")
         print(f"Fator de carga:        {report['fator_de_carga']}")
+        print(f"Posições removidas:    {report['lapides']}")
+        print(f"Redimensionamentos:    {report['redimensionamentos']}")
+        print(f"Compactações:          {report['compactacoes']}")
         print(f"Colisões totais:       {report['colisoes_totais']}")
         print(f"Tempo médio inserção:  {report['tempo_medio_insercao']:.8f} s")
         print(f"Tempo médio busca:     {report['tempo_medio_busca']:.8f} s")
         print(f"Tempo médio remoção:   {report['tempo_medio_remocao']:.8f} s")
+        print("Distribuição das latências:")
+        for nome, chave in (
+            ("inserção", "latencia_insercao"),
+            ("busca", "latencia_busca"),
+            ("remoção", "latencia_remocao"),
+        ):
+            print("  " + format_summary(nome, report[chave]))
 
 if __name__ == "__main__":
     h = OpenAddressHashTable(size=7, method="double", debug=True)
@@ -181,6 +748,16 @@ if __name__ == "__main__":
     print("\nTabela após remoção de 24:")
     h.remove(32)
 
+    h.print_table()
+
+    print("\nReinserindo 43 (já está na tabela) e 32 (posição removida):")
+    h.insert(43)
+    h.insert(32)
+
+    h.upsert(10, 1, lambda v: (v or 0) + 1)
+    h.upsert(10, 1, lambda v: (v or 0) + 1)
+    print("\nContador da chave 10 após dois upserts:", h.get(10))
+
     h.print_table()
     print()
 
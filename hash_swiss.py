@@ -0,0 +1,348 @@
+import time
+
+from latency import LatencyHistogram, format_summary
+from tracing import make_trace
+from hashing import make_hash_function, next_power_of_two
+
+TRACE_MESSAGES = {
+    "insert_start": "\n[INSERIR] Quero inserir a chave {key}\nGrupo inicial: {group}, fragmento: {fragment}",
+    "group": "Grupo {group}: bytes de controle {control}",
+    "candidate": "Fragmento coincide na posição {index}: comparando com {slot}",
+    "insert_duplicate": "A chave já está na tabela na posição {index}",
+    "insert_slot": "Chave guardada na posição {index} (grupo {group})",
+    "search_start": "\n[BUSCAR] Procurando a chave {key}\nGrupo inicial: {group}, fragmento: {fragment}",
+    "search_found": "Chave encontrada na posição {index}",
+    "search_missing": "Grupo tem posição vazia e nenhum fragmento igual: chave não está na tabela",
+    "remove_start": "\n[REMOVER] Tentando remover a chave {key}",
+    "remove_empty": "Chave removida da posição {index}: o grupo ainda tem posição vazia, o byte volta a VAZIO",
+    "remove_deleted": "Chave removida da posição {index}: grupo cheio, o byte fica como REMOVIDO",
+    "remove_missing": "Chave não existe",
+    "resize": "Ocupação {load:.2f} (chaves + removidas): reorganizando de {old_size} para {new_size} posições",
+}
+
+GROUP_WIDTH = 16
+EMPTY = 0x80
+DELETED = 0xFE
+_MISSING = object()
+
+
+class SwissHashTable:
+    def __init__(
+        self,
+        size=16,
+        max_load_factor=0.875,
+        debug=False,
+        trace_sink=None,
+        timing=True,
+        hash_function="python",
+        seed=None,
+    ):
+        if not 0 < max_load_factor < 1:
+            raise ValueError("O fator de carga máximo precisa estar entre 0 e 1 para sempre restar uma posição vazia")
+        self.hash_function = make_hash_function(hash_function, seed)
+        self.max_load_factor = max_load_factor
+        self._allocate(max(GROUP_WIDTH, next_power_of_two(size)))
+        self.count = 0
+        self.tombstones = 0
+
+        self.resize_count = 0
+        self.compaction_count = 0
+        self.collision_count = 0
+        self.timing = timing
+        self.insert_latency = LatencyHistogram()
+        self.search_latency = LatencyHistogram()
+        self.remove_latency = LatencyHistogram()
+
+        self.debug = debug
+        self._trace = make_trace(TRACE_MESSAGES, debug, trace_sink)
+
+    def _allocate(self, size):
+        self.size = size
+        self.group_mask = size // GROUP_WIDTH - 1
+        self.control = bytearray([EMPTY]) * size
+        self.table = [None] * size
+        self.values = [None] * size
+
+    def load_factor(self):
+        return self.count / self.size
+
+    def _find(self, key, h, trace=None):
+        fragment = h & 0x7F
+        control = self.control
+        table = self.table
+        group_mask = self.group_mask
+        group = (h >> 7) & group_mask
+        step = 0
+        while True:
+            start = group * GROUP_WIDTH
+            end = start + GROUP_WIDTH
+            if trace is not None:
+                trace("group", group=group, control=control[start:end].hex(" "))
+
+            index = control.find(fragment, start, end)
+            while index >= 0:
+                slot = table[index]
+                if trace is not None:
+                    trace("candidate", index=index, slot=slot)
+                if slot is key or slot == key:
+                    return index
+                index = control.find(fragment, index + 1, end)
+
+            if control.find(EMPTY, start, end) >= 0:
+                return -1
+            step += 1
+            group = (group + step) & group_mask
+
+    def _place(self, key, value, h, trace=None):
+        control = self.control
+        group_mask = self.group_mask
+        group = (h >> 7) & group_mask
+        step = 0
+        while True:
+            start = group * GROUP_WIDTH
+            end = start + GROUP_WIDTH
+            index = control.find(EMPTY, start, end)
+            deleted = control.find(DELETED, start, end)
+            if deleted >= 0 and (index < 0 or deleted < index):
+                index = deleted
+                self.tombstones -= 1
+
+            if index >= 0:
+                control[index] = h & 0x7F
+                self.table[index] = key
+                self.values[index] = value
+                if step:
+                    self.collision_count += 1
+                if trace is not None:
+                    trace("insert_slot", index=index, group=group)
+                return
+            step += 1
+            group = (group + step) & group_mask
+
+    def _resize(self, new_size):
+        if self._trace is not None:
+            self._trace(
+                "resize",
+                load=(self.count + self.tombstones) / self.size,
+                old_size=self.size,
+                new_size=new_size,
+            )
+        if new_size == self.size:
+            self.compaction_count += 1
+        else:
+            self.resize_count += 1
+
+        items = [
+            (key, value)
+            for key, value, byte in zip(self.table, self.values, self.control)
+            if byte < EMPTY
+        ]
+        self._allocate(new_size)
+        self.tombstones = 0
+        hash_function = self.hash_function
+        for key, value in items:
+            self._place(key, value, hash_function(key))
+
+    def _check_grow(self):
+        if self.count + self.tombstones + 1 <= self.max_load_factor * self.size:
+            return
+        if self.tombstones >= self.count:
+            self._resize(self.size)
+        else:
+            self._resize(2 * self.size)
+
+    def _insert(self, key, value=None, overwrite=False):
+        trace = self._trace
+        h = self.hash_function(key)
+        if trace is not None:
+            trace("insert_start", key=key, group=(h >> 7) & self.group_mask, fragment=h & 0x7F)
+
+        index = self._find(key, h, trace)
+        if index >= 0:
+            if overwrite:
+                self.values[index] = value
+            if trace is not None:
+                trace("insert_duplicate", index=index)
+            return False
+
+        self._check_grow()
+        self._place(key, value, h, trace)
+        self.count += 1
+        return True
+
+    def _search(self, key):
+        trace = self._trace
+        h = self.hash_function(key)
+        if trace is None:
+            return self._find(key, h) >= 0
+
+        trace("search_start", key=key, group=(h >> 7) & self.group_mask, fragment=h & 0x7F)
+        index = self._find(key, h, trace)
+        if index >= 0:
+            trace("search_found", index=index)
+            return True
+        trace("search_missing")
+        return False
+
+    def _get(self, key, default=None):
+        index = self._find(key, self.hash_function(key))
+        if index >= 0:
+            return self.values[index]
+        return default
+
+    def _pop(self, key):
+        trace = self._trace
+        if trace is not None:
+            trace("remove_start", key=key)
+
+        index = self._find(key, self.hash_function(key), trace)
+        if index < 0:
+            if trace is not None:
+                trace("remove_missing")
+            return False, None
+
+        value = self.values[index]
+        self.table[index] = None
+        self.values[index] = None
+        self.count -= 1
+
+        start = index - index % GROUP_WIDTH
+        if self.control.find(EMPTY, start, start + GROUP_WIDTH) >= 0:
+            self.control[index] = EMPTY
+            if trace is not None:
+                trace("remove_empty", index=index)
+        else:
+            self.control[index] = DELETED
+            self.tombstones += 1
+            if trace is not None:
+                trace("remove_deleted", index=index)
+        return True, value
+
+    def _remove(self, key):
+        return self._pop(key)[0]
+
+    def insert(self, key):
+        if not self.timing:
+            return self._insert(key)
+        start = time.perf_counter()
+        result = self._insert(key)
+        self.insert_latency.record(time.perf_counter() - start)
+        return result
+
+    def search(self, key):
+        if not self.timing:
+            return self._search(key)
+        start = time.perf_counter()
+        result = self._search(key)
+        self.search_latency.record(time.perf_counter() - start)
+        return result
+
+    def remove(self, key):
+        if not self.timing:
+            return self._remove(key)
+        start = time.perf_counter()
+        result = self._remove(key)
+        self.remove_latency.record(time.perf_counter() - start)
+        return result
+
+    def put(self, key, value):
+        if not self.timing:
+            return self._insert(key, value, True)
+        start = time.perf_counter()
+        result = self._insert(key, value, True)
+        self.insert_latency.record(time.perf_counter() - start)
+        return result
+
+    def get(self, key, default=None):
+        if not self.timing:
+            return self._get(key, default)
+        start = time.perf_counter()
+        result = self._get(key, default)
+        self.search_latency.record(time.perf_counter() - start)
+        return result
+
+    def pop(self, key, default=_MISSING):
+        if not self.timing:
+            found, value = self._pop(key)
+        else:
+            start = time.perf_counter()
+            found, value = self._pop(key)
+            self.remove_latency.record(time.perf_counter() - start)
+
+        if found:
+            return value
+        if default is _MISSING:
+            raise KeyError(key)
+        return default
+
+    def __contains__(self, key):
+        return self.search(key)
+
+    def __len__(self):
+        return self.count
+
+    def report(self):
+        return {
+            "tamanho_tabela": self.size,
+            "fator_de_carga": round(self.load_factor(), 3),
+            "colisoes_totais": self.collision_count,
+            "lapides": self.tombstones,
+            "redimensionamentos": self.resize_count,
+            "compactacoes": self.compaction_count,
+            "tempo_medio_insercao": self.insert_latency.mean(),
+            "tempo_medio_busca": self.search_latency.mean(),
+            "tempo_medio_remocao": self.remove_latency.mean(),
+            "latencia_insercao": self.insert_latency.summary(),
+            "latencia_busca": self.search_latency.summary(),
+            "latencia_remocao": self.remove_latency.summary(),
+        }
+
+    def print_table(self):
+        print(f"\nTabela Hash (swiss, grupos de {GROUP_WIDTH}):")
+        for group in range(self.size // GROUP_WIDTH):
+            start = group * GROUP_WIDTH
+            print(f"Grupo {group}: {self.control[start:start + GROUP_WIDTH].hex(' ')}")
+            for i in range(start, start + GROUP_WIDTH):
+                byte = self.control[i]
+                if byte == EMPTY:
+                    continue
+                if byte == DELETED:
+                    print(f"  {i}: REMOVIDO")
+                else:
+                    print(f"  {i}: {self.table[i]}")
+
+
+def print_report(report):
+    print("\nMétricas da tabela Hash (swiss):")
+    print(f"Tamanho da tabela:     {report['tamanho_tabela']}")
+    print(f"Fator de carga:        {report['fator_de_carga']}")
+    print(f"Colisões totais:       {report['colisoes_totais']}")
+    print(f"Lápides:               {report['lapides']}")
+    print(f"Redimensionamentos:    {report['redimensionamentos']}")
+    print(f"Compactações:          {report['compactacoes']}")
+    print(f"Tempo médio inserção:  {report['tempo_medio_insercao']:.8f} s")
+    print(f"Tempo médio busca:     {report['tempo_medio_busca']:.8f} s")
+    print(f"Tempo médio remoção:   {report['tempo_medio_remocao']:.8f} s")
+    print("Distribuição das latências:")
+    for nome, chave in (
+        ("inserção", "latencia_insercao"),
+        ("busca", "latencia_busca"),
+        ("remoção", "latencia_remocao"),
+    ):
+        print("  " + format_summary(nome, report[chave]))
+
+
+if __name__ == "__main__":
+    h = SwissHashTable(size=16, debug=True)
+
+    for chave in (10, 17, 21, 32, 43, 54, 138, 266):
+        h.insert(chave)
+
+    h.print_table()
+
+    h.search(21)
+    h.search(99)
+    h.remove(32)
+
+    h.print_table()
+    print_report(h.report())
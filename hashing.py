@@ -0,0 +1,82 @@
+import random
+
+MASK64 = (1 << 64) - 1
+GOLDEN64 = 0x9E3779B97F4A7C15
+_REVERSED_BYTES = bytes(int(f"{b:08b}"[::-1], 2) for b in range(256))
+
+
+def next_power_of_two(n):
+    return 1 << max(0, n - 1).bit_length()
+
+
+class FibonacciHash:
+    name = "fibonacci"
+
+    def __init__(self, seed=None):
+        pass
+
+    def __call__(self, key):
+        # Bits do produto invertidos: a máscara de k bits pega os k bits mais altos
+        product = hash(key) * GOLDEN64 & MASK64
+        return int.from_bytes(product.to_bytes(8, "little").translate(_REVERSED_BYTES), "big")
+
+
+class SplitMixHash:
+    name = "splitmix"
+
+    def __init__(self, seed=None):
+        self.seed = random.Random(seed).getrandbits(64)
+
+    def __call__(self, key):
+        z = (hash(key) + self.seed + GOLDEN64) & MASK64
+        z = (z ^ (z >> 30)) * 0xBF58476D1CE4E5B9 & MASK64
+        z = (z ^ (z >> 27)) * 0x94D049BB133111EB & MASK64
+        return z ^ (z >> 31)
+
+
+class TabulationHash:
+    name = "tabulation"
+
+    def __init__(self, seed=None):
+        rng = random.Random(seed)
+        self.tables = [[rng.getrandbits(64) for _ in range(256)] for _ in range(8)]
+
+    def __call__(self, key):
+        h = hash(key) & MASK64
+        t0, t1, t2, t3, t4, t5, t6, t7 = self.tables
+        return (
+            t0[h & 0xFF]
+            ^ t1[(h >> 8) & 0xFF]
+            ^ t2[(h >> 16) & 0xFF]
+            ^ t3[(h >> 24) & 0xFF]
+            ^ t4[(h >> 32) & 0xFF]
+            ^ t5[(h >> 40) & 0xFF]
+            ^ t6[(h >> 48) & 0xFF]
+            ^ t7[h >> 56]
+        )
+
+
+HASH_FUNCTIONS = {
+    "python": None,
+    FibonacciHash.name: FibonacciHash,
+    SplitMixHash.name: SplitMixHash,
+    TabulationHash.name: TabulationHash,
+}
+
+
+def make_hash_function(name="python", seed=None):
+    if callable(name):
+        return name
+    if name not in HASH_FUNCTIONS:
+        raise ValueError(f"Função de hash desconhecida: {name}")
+    factory = HASH_FUNCTIONS[name]
+    if factory is None:
+        return hash
+    return factory(seed)
+
+
+if __name__ == "__main__":
+    chaves = [i * 1024 for i in range(8)]
+    for nome in HASH_FUNCTIONS:
+        funcao = make_hash_function(nome, seed=42)
+        print(f"{nome:<10} posições em 16 (máscara): {[funcao(c) & 15 for c in chaves]}")
@@ -0,0 +1,129 @@
+import math
+from array import array
+
+
+class LatencyHistogram:
+    def __init__(self, sub_bucket_bits=7, max_shift=40):
+        self.sub_bucket_bits = sub_bucket_bits
+        self.max_shift = max_shift
+
+        self._linear = 1 << sub_bucket_bits
+        self._half = self._linear >> 1
+        self._buckets = self._linear + max_shift * self._half
+        self.counts = None
+
+        self.total = 0
+        self.sum_ns = 0
+        self.max_ns = 0
+
+    def _index(self, ns):
+        if ns < self._linear:
+            return ns
+        shift = ns.bit_length() - self.sub_bucket_bits
+        if shift > self.max_shift:
+            return self._buckets - 1
+        return self._linear + (shift - 1) * self._half + (ns >> shift) - self._half
+
+    def _upper_bound(self, index):
+        if index < self._linear:
+            return index
+        shift = (index - self._linear) // self._half + 1
+        top = (index - self._linear) % self._half + self._half
+        return ((top + 1) << shift) - 1
+
+    def record(self, seconds):
+        ns = int(seconds * 1e9)
+        if ns < 0:
+            ns = 0
+        counts = self.counts
+        if counts is None:
+            counts = self.counts = array("Q", bytes(8 * self._buckets))
+        counts[self._index(ns)] += 1
+        self.total += 1
+        self.sum_ns += ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+
+    def merge(self, other):
+        if (
+            other.sub_bucket_bits != self.sub_bucket_bits
+            or other.max_shift != self.max_shift
+        ):
+            raise ValueError("Histogramas com configurações diferentes não podem ser combinados")
+
+        if other.counts is not None:
+            if self.counts is None:
+                self.counts = array("Q", other.counts)
+            else:
+                counts = self.counts
+                for i, c in enumerate(other.counts):
+                    if c:
+                        counts[i] += c
+        self.total += other.total
+        self.sum_ns += other.sum_ns
+        self.max_ns = max(self.max_ns, other.max_ns)
+        return self
+
+    def reset(self):
+        self.counts = None
+        self.total = 0
+        self.sum_ns = 0
+        self.max_ns = 0
+
+    def mean(self):
+        return self.sum_ns / self.total / 1e9 if self.total else 0.0
+
+    def max(self):
+        return self.max_ns / 1e9
+
+    def percentile(self, p):
+        if self.total == 0:
+            return 0.0
+
+        target = max(1, math.ceil(p / 100 * self.total))
+        seen = 0
+        for i, c in enumerate(self.counts):
+            seen += c
+            if seen >= target:
+                return min(self._upper_bound(i), self.max_ns) / 1e9
+        return self.max()
+
+    def memory_bytes(self):
+        if self.counts is None:
+            return 0
+        return self.counts.itemsize * len(self.counts)
+
+    def summary(self):
+        return {
+            "contagem": self.total,
+            "media": self.mean(),
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "p999": self.percentile(99.9),
+            "max": self.max(),
+        }
+
+
+def format_summary(nome, resumo):
+    return (
+        f"{nome:<10} média {resumo['media']:.2e} s | "
+        f"p50 {resumo['p50']:.2e} | p90 {resumo['p90']:.2e} | "
+        f"p99 {resumo['p99']:.2e} | p99.9 {resumo['p999']:.2e} | "
+        f"máx {resumo['max']:.2e} s ({resumo['contagem']} ops)"
+    )
+
+
+if __name__ == "__main__":
+    import random
+
+    histograma = LatencyHistogram()
+    outro = LatencyHistogram()
+    for _ in range(100_000):
+        histograma.record(random.expovariate(1 / 2e-6))
+        outro.record(random.expovariate(1 / 5e-6))
+
+    print(format_summary("A", histograma.summary()))
+    print(format_summary("B", outro.summary()))
+    print(format_summary("A + B", histograma.merge(outro).summary()))
+    print("Memória por histograma:", histograma.memory_bytes(), "bytes")
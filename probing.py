@@ -0,0 +1,114 @@
+import copy
+from itertools import accumulate, chain
+from math import gcd
+
+
+def next_prime(n):
+    while n < 2 or any(n % d == 0 for d in range(2, int(n ** 0.5) + 1)):
+        n += 1
+    return n
+
+
+class ProbeStrategy:
+    name = None
+    robin_hood = False
+    power_of_two = False
+
+    def __init__(self, power_of_two=False):
+        self.power_of_two = power_of_two
+
+    def masked(self):
+        strategy = copy.copy(self)
+        strategy.power_of_two = True
+        return strategy
+
+    def check_size(self, size):
+        if self.power_of_two and size & (size - 1):
+            raise ValueError("Posições por máscara exigem tamanho de tabela potência de 2")
+
+    def next_size(self, size):
+        if self.power_of_two:
+            return 2 * size
+        return next_prime(2 * size + 1)
+
+    def home(self, h, size):
+        if self.power_of_two:
+            return h & (size - 1)
+        return h % size
+
+    def reducer(self, size):
+        if self.power_of_two:
+            return (size - 1).__rand__
+        return size.__rmod__
+
+    def probes(self, h, size):
+        raise NotImplementedError
+
+
+class LinearProbing(ProbeStrategy):
+    name = "linear"
+
+    def probes(self, h, size):
+        start = h & (size - 1) if self.power_of_two else h % size
+        return chain(range(start, size), range(start))
+
+
+class QuadraticProbing(ProbeStrategy):
+    name = "quadratic"
+
+    def probes(self, h, size):
+        reduce = self.reducer(size)
+        return map(reduce, accumulate(range(1, 2 * size - 1, 2), initial=reduce(h)))
+
+
+class DoubleHashing(ProbeStrategy):
+    name = "double"
+
+    def probes(self, h, size):
+        reduce = self.reducer(size)
+        start = reduce(h)
+        step = 1 + h % (size - 1)
+        while gcd(step, size) != 1:
+            step += 1
+        return map(reduce, range(start, start + size * step, step))
+
+
+class RobinHoodProbing(LinearProbing):
+    name = "robinhood"
+    robin_hood = True
+
+
+class TriangularProbing(ProbeStrategy):
+    name = "triangular"
+
+    def check_size(self, size):
+        if size & (size - 1):
+            raise ValueError("Sondagem triangular exige tamanho de tabela potência de 2")
+
+    def next_size(self, size):
+        return 2 * size
+
+    def home(self, h, size):
+        return h & (size - 1)
+
+    def probes(self, h, size):
+        mask = size - 1
+        return map(mask.__rand__, accumulate(range(1, size), initial=h & mask))
+
+
+PROBE_STRATEGIES = {}
+
+
+def register_probe_strategy(strategy):
+    PROBE_STRATEGIES[strategy.name] = strategy
+    return strategy
+
+
+for _strategy in (LinearProbing, QuadraticProbing, DoubleHashing, RobinHoodProbing, TriangularProbing):
+    register_probe_strategy(_strategy())
+
+
+if __name__ == "__main__":
+    for nome, estrategia in PROBE_STRATEGIES.items():
+        tamanho = 8 if nome == "triangular" else 11
+        print(f"{nome:<10} chave 21, tamanho {tamanho}: {list(estrategia.probes(hash(21), tamanho))}")
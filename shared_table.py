@@ -0,0 +1,170 @@
+import os
+import struct
+import sys
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+from snapshot import HEADER, MAGIC, KIND_HASH, MappedHashSnapshot, build_hash_slots, little_endian
+
+GENERATION = struct.Struct("<q")
+SEGMENT_NAME = struct.Struct("<64s")
+CONTROL_SIZE = GENERATION.size + SEGMENT_NAME.size
+_TRACKER_REGISTERS_ATTACH = os.name == "posix" and sys.version_info < (3, 13)
+
+
+def _attach_segment(name):
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)
+    shm = SharedMemory(name=name)
+    if _TRACKER_REGISTERS_ATTACH:
+        resource_tracker.unregister(shm._name, "shared_memory")
+    return shm
+
+
+def _unlink_segment(shm):
+    # Um leitor que divide o resource_tracker com o publicador pode ter removido o registro
+    if _TRACKER_REGISTERS_ATTACH:
+        resource_tracker.register(shm._name, "shared_memory")
+    shm.close()
+    shm.unlink()
+
+
+class SharedHashTable(MappedHashSnapshot):
+    def __init__(self, name):
+        self.name = name
+        self._shm = _attach_segment(name)
+        self._attach(self._shm.buf, name)
+
+    def close(self):
+        self.slots.release()
+        self._shm.close()
+
+
+class SharedTablePublisher:
+    def __init__(self, name=None):
+        self._control = SharedMemory(name=name, create=True, size=CONTROL_SIZE)
+        GENERATION.pack_into(self._control.buf, 0, 0)
+        self.name = self._control.name
+        self._segment = None
+        self.generation = 0
+
+    def publish(self, keys, load_factor=0.5):
+        count, slots = build_hash_slots(keys, load_factor)
+        data = memoryview(little_endian(slots)).cast("B")
+        segment = SharedMemory(create=True, size=HEADER.size + len(data))
+        HEADER.pack_into(segment.buf, 0, MAGIC, KIND_HASH, count, len(slots))
+        segment.buf[HEADER.size:HEADER.size + len(data)] = data
+
+        buf = self._control.buf
+        sequence = 2 * self.generation
+        GENERATION.pack_into(buf, 0, sequence + 1)
+        SEGMENT_NAME.pack_into(buf, GENERATION.size, segment.name.encode())
+        GENERATION.pack_into(buf, 0, sequence + 2)
+
+        previous, self._segment = self._segment, segment
+        if previous is not None:
+            _unlink_segment(previous)
+        self.generation += 1
+        return self.generation
+
+    def close(self):
+        if self._segment is not None:
+            _unlink_segment(self._segment)
+            self._segment = None
+        _unlink_segment(self._control)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class SharedTableReader:
+    def __init__(self, name):
+        self._control = _attach_segment(name)
+        self.table = None
+        self.generation = 0
+        self.swap_count = 0
+        if not self.refresh():
+            self._control.close()
+            raise ValueError(f"Nenhuma tabela publicada em {name}")
+
+    def _read_control(self):
+        buf = self._control.buf
+        while True:
+            sequence = GENERATION.unpack_from(buf, 0)[0]
+            if sequence & 1:
+                continue
+            name = SEGMENT_NAME.unpack_from(buf, GENERATION.size)[0]
+            if GENERATION.unpack_from(buf, 0)[0] == sequence:
+                return sequence // 2, name.rstrip(b"\0").decode()
+
+    def refresh(self):
+        while True:
+            generation, name = self._read_control()
+            if generation == self.generation:
+                return False
+            try:
+                table = SharedHashTable(name)
+            except FileNotFoundError:
+                continue
+            break
+
+        if self.table is not None:
+            self.table.close()
+            self.swap_count += 1
+        self.table = table
+        self.generation = generation
+        return True
+
+    def search(self, key):
+        return self.table.search(key)
+
+    def __contains__(self, key):
+        return self.table.search(key)
+
+    def __len__(self):
+        return self.table.count
+
+    def close(self):
+        if self.table is not None:
+            self.table.close()
+            self.table = None
+        self._control.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+if __name__ == "__main__":
+    import subprocess
+
+    with SharedTablePublisher() as publicador:
+        publicador.publish([10, 17, 21, 32, 43, 54])
+        with SharedTableReader(publicador.name) as leitor:
+            print(f"Geração {leitor.generation}: {len(leitor)} chaves | 21: {21 in leitor} | 99: {99 in leitor}")
+
+            publicador.publish([10, 17, 21, 99])
+            print("Antes de atualizar, 99:", 99 in leitor)
+            leitor.refresh()
+            print(f"Geração {leitor.generation}: {len(leitor)} chaves | 21: {21 in leitor} | 99: {99 in leitor}")
+            print("Trocas de tabela no leitor:", leitor.swap_count)
+
+        codigo = (
+            "from shared_table import SharedTableReader\n"
+            f"with SharedTableReader({publicador.name!r}) as leitor:\n"
+            "    print(len(leitor), 99 in leitor)\n"
+        )
+        processo = subprocess.run(
+            [sys.executable, "-c", codigo],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True,
+        )
+        print("Leitor em processo independente:", processo.stdout.strip(), processo.stderr.strip())
+        with SharedTableReader(publicador.name) as leitor:
+            print(f"Depois que ele saiu: geração {leitor.generation}, {len(leitor)} chaves | 99: {99 in leitor}")
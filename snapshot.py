@@ -0,0 +1,195 @@
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+
+from hashing import GOLDEN64, MASK64, next_power_of_two
+
+MAGIC = b"ACCSNAP1"
+HEADER = struct.Struct("<8sB7xQQ")
+KIND_HASH = 1
+KIND_SORTED = 2
+EMPTY = -(1 << 63)
+NATIVE_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+def little_endian(slots):
+    if NATIVE_LITTLE_ENDIAN:
+        return slots
+    slots = array("q", slots)
+    slots.byteswap()
+    return slots
+
+
+def _write(path, kind, count, slots):
+    with open(path, "wb") as arquivo:
+        arquivo.write(HEADER.pack(MAGIC, kind, count, len(slots)))
+        little_endian(slots).tofile(arquivo)
+
+
+def build_hash_slots(keys, load_factor=0.5):
+    keys = list(keys)
+    size = max(2, next_power_of_two(int(len(keys) / load_factor) + 1))
+    mask = size - 1
+    shift = 64 - (size.bit_length() - 1)
+    slots = array("q", [EMPTY]) * size
+    count = 0
+
+    for key in keys:
+        if key == EMPTY:
+            raise ValueError("Chave reservada para posição vazia não pode ser usada")
+        index = (hash(key) * GOLDEN64 & MASK64) >> shift
+        while slots[index] != EMPTY:
+            if slots[index] == key:
+                break
+            index = (index + 1) & mask
+        else:
+            slots[index] = key
+            count += 1
+    return count, slots
+
+
+def write_hash_snapshot(path, keys, load_factor=0.5):
+    count, slots = build_hash_slots(keys, load_factor)
+    _write(path, KIND_HASH, count, slots)
+    return count
+
+
+def write_sorted_snapshot(path, keys):
+    slots = array("q", sorted(set(keys)))
+    _write(path, KIND_SORTED, len(slots), slots)
+    return len(slots)
+
+
+class MappedSnapshot:
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        self._map = None
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._attach(self._map, path)
+        except (ValueError, struct.error):
+            self.close()
+            raise
+
+    def _attach(self, buffer, source):
+        if len(buffer) < HEADER.size:
+            raise ValueError(f"Arquivo não é um snapshot válido: {source}")
+        magic, self.kind, self.count, self.size = HEADER.unpack_from(buffer)
+        if magic != MAGIC:
+            raise ValueError(f"Arquivo não é um snapshot válido: {source}")
+        end = HEADER.size + 8 * self.size
+        if end > len(buffer) or self.count > self.size:
+            raise ValueError(f"Snapshot truncado ou corrompido: {source}")
+        view = memoryview(buffer)[HEADER.size:end]
+        if NATIVE_LITTLE_ENDIAN:
+            self.slots = view.cast("q")
+        else:
+            slots = array("q")
+            slots.frombytes(view)
+            view.release()
+            slots.byteswap()
+            self.slots = memoryview(slots)
+
+    def close(self):
+        slots = getattr(self, "slots", None)
+        if slots is not None:
+            slots.release()
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, key):
+        return self.search(key)
+
+    def memory_bytes(self):
+        return HEADER.size + 8 * self.size
+
+
+class MappedHashSnapshot(MappedSnapshot):
+    def _attach(self, buffer, source):
+        super()._attach(buffer, source)
+        if self.size < 2 or self.size & (self.size - 1):
+            raise ValueError(f"Snapshot hash com tamanho inválido ({self.size}): {source}")
+        self.mask = self.size - 1
+        self.shift = 64 - (self.size.bit_length() - 1)
+
+    def search(self, key):
+        slots = self.slots
+        mask = self.mask
+        index = (hash(key) * GOLDEN64 & MASK64) >> self.shift
+        while True:
+            slot = slots[index]
+            if slot == EMPTY:
+                return False
+            if slot == key:
+                return True
+            index = (index + 1) & mask
+
+
+class MappedSortedSnapshot(MappedSnapshot):
+    def search(self, key):
+        slots = self.slots
+        index = bisect_left(slots, key)
+        return index < self.size and slots[index] == key
+
+    def range_query(self, lo, hi):
+        slots = self.slots
+        return slots[bisect_left(slots, lo):bisect_right(slots, hi)].tolist()
+
+
+def open_snapshot(path):
+    with open(path, "rb") as arquivo:
+        header = arquivo.read(HEADER.size)
+    if len(header) < HEADER.size:
+        raise ValueError(f"Arquivo não é um snapshot válido: {path}")
+    magic, kind, _, _ = HEADER.unpack(header)
+    if magic != MAGIC:
+        raise ValueError(f"Arquivo não é um snapshot válido: {path}")
+    if kind == KIND_HASH:
+        return MappedHashSnapshot(path)
+    if kind == KIND_SORTED:
+        return MappedSortedSnapshot(path)
+    raise ValueError(f"Tipo de snapshot desconhecido ({kind}): {path}")
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    import avl
+    from hash_open import OpenAddressHashTable
+
+    tabela = OpenAddressHashTable(size=11, timing=False)
+    raiz = None
+    for chave in (10, 17, 21, 32, 43, 54):
+        tabela.insert(chave)
+        raiz = avl.insert(raiz, chave)
+
+    pasta = tempfile.mkdtemp()
+    caminho_hash = os.path.join(pasta, "tabela.snap")
+    caminho_avl = os.path.join(pasta, "avl.snap")
+    write_hash_snapshot(caminho_hash, tabela.keys())
+    write_sorted_snapshot(caminho_avl, avl.iter_inorder(raiz))
+
+    with open_snapshot(caminho_hash) as snapshot:
+        print(f"Snapshot hash: {len(snapshot)} chaves em {snapshot.size} posições ({snapshot.memory_bytes()} bytes)")
+        print("21 no snapshot:", 21 in snapshot, "| 99 no snapshot:", 99 in snapshot)
+
+    with open_snapshot(caminho_avl) as snapshot:
+        print(f"Snapshot ordenado: {len(snapshot)} chaves ({snapshot.memory_bytes()} bytes)")
+        print("Intervalo [15, 40]:", snapshot.range_query(15, 40))
+
+    os.remove(caminho_hash)
+    os.remove(caminho_avl)
+    os.rmdir(pasta)
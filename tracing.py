@@ -0,0 +1,23 @@
+class TextSink:
+    def __init__(self, messages, write=print):
+        self.messages = messages
+        self.write = write
+
+    def __call__(self, event, **fields):
+        self.write(self.messages[event].format(**fields))
+
+
+class ListSink:
+    def __init__(self):
+        self.events = []
+
+    def __call__(self, event, **fields):
+        self.events.append((event, fields))
+
+
+def make_trace(messages, debug, trace_sink):
+    if trace_sink is not None:
+        return trace_sink
+    if debug:
+        return TextSink(messages)
+    return None